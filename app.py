@@ -1,8 +1,5 @@
 import streamlit as st
-from supabase import create_client, Client
 import os
-import pandas as pd
-import numpy as np
 # from dotenv import load_dotenv # UNCOMMENT WITH LOCAL DEV
 
 # load_dotenv() #  - UNCOMMENT WITH LOCAL DEV
@@ -20,50 +17,215 @@ if not st.session_state.authenticated:
     else:
         st.stop()
 
+# ─────────────────────────────
+# Heavy Imports (after the password gate so it renders first)
+# ─────────────────────────────
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from concurrent.futures import ThreadPoolExecutor
+import html
+import pandas as pd
+from supabase import Client
+from supabase_client import create_http_client, create_pooled_client
+from supabase_fetch import fetch_latest, fetch_rows, select_list
+from result_cache import ResultCache
+from snapshot_store import SnapshotStore
+from links_index import build_links_index, team_players
+from schema import apply_schema
+import timing
+from overs import invalid_overs
+from wire_format import RestClient
+from stats_engine import (
+    BATTING_INPUT_COLUMNS, BOWLING_INPUT_COLUMNS, LEADER_KEYS, SUMMARY_BATTING_COLUMNS, SUMMARY_BOWLING_COLUMNS,
+    batting_leaderboard, batting_player_season, bowling_leaderboard, bowling_player_season, dismissal_types,
+    fill_season, overall_batting, overall_bowling, prepare_batting, prepare_bowling, reorder_columns, season_batting,
+    season_bowling, unpack_dismissals
+)
+
+# Copy-on-Write: frames shared through the caches are never modified in place (default from pandas 3)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 # ─────────────────────────────
 # Set Wide Layout
 # ─────────────────────────────
 st.set_page_config(layout="wide")
 
 # ─────────────────────────────
-# Supabase Read-Only Client
+# Optional Settings (environment first, then Streamlit secrets)
+# ─────────────────────────────
+def get_setting(name: str, default=None):
+    value = os.getenv(name)
+    if value is not None:
+        return value
+    try:
+        return st.secrets.get(name, default)
+    except FileNotFoundError:  # no secrets.toml - e.g. local runs configured via .env
+        return default
+
+# ─────────────────────────────
+# Timing (one run per rerun; spans appended to TIMING_LOG as JSON lines when set)
+# ─────────────────────────────
+TIMING_LOG = get_setting("TIMING_LOG")
+SHOW_ADMIN = (str(get_setting("ADMIN_PANEL", "")).lower() in ("1", "true", "yes")
+              or st.query_params.get("admin") == "1")
+_script_ctx = get_script_run_ctx()
+timing_run = timing.start_run("rerun", log_path=TIMING_LOG,
+                              session=_script_ctx.session_id if _script_ctx else None)
+
+# ─────────────────────────────
+# Supabase Read-Only Client (one pooled client shared by all sessions and reruns)
 # ─────────────────────────────
 SUPABASE_URL = os.getenv("SUPABASE_URL") or st.secrets["SUPABASE_URL"]
 SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY") or st.secrets["SUPABASE_ANON_KEY"]
-supabase_anon: Client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
+
+@st.cache_resource
+def get_supabase_client() -> Client:
+    with timing.span("client_init", client="supabase"):
+        return create_pooled_client(
+            SUPABASE_URL, SUPABASE_ANON_KEY,
+            pool_size=int(get_setting("SUPABASE_POOL_SIZE", 20)),
+            timeout=float(get_setting("SUPABASE_TIMEOUT", 30)),
+        )
+
+supabase_anon: Client = get_supabase_client()
+
+# Bulk reads can ask PostgREST for CSV (or Arrow via a local proxy at REST_URL) instead of JSON
+WIRE_FORMAT = str(get_setting("WIRE_FORMAT", "json")).lower()
+
+@st.cache_resource
+def get_read_client():
+    if WIRE_FORMAT == "json":
+        return supabase_anon
+    with timing.span("client_init", client=f"rest-{WIRE_FORMAT}"):
+        return RestClient(
+            get_setting("REST_URL", f"{SUPABASE_URL}/rest/v1"), SUPABASE_ANON_KEY,
+            http=create_http_client(
+                pool_size=int(get_setting("SUPABASE_POOL_SIZE", 20)),
+                timeout=float(get_setting("SUPABASE_TIMEOUT", 30)),
+            ),
+            fmt=WIRE_FORMAT,
+        )
+
+read_client = get_read_client()
 
 # ─────────────────────────────
-# Bowling Economy Rate Function
+# Shared Result Cache (team batting/bowling data across reruns and sessions)
 # ─────────────────────────────
-def convert_decimal_overs_to_float(overs_series):
-    """Convert cricket-style decimal overs (e.g. 3.5) to float overs (e.g. 3.8333)"""
-    overs_series = overs_series.astype(float).fillna(0)
-    full_overs = overs_series.astype(int)
-    balls = ((overs_series - full_overs) * 10).round().astype(int)
-    return full_overs + (balls / 6)
+@st.cache_resource
+def get_result_cache() -> ResultCache:
+    return ResultCache(
+        ttl=int(get_setting("RESULT_CACHE_TTL", 3600)),
+        max_bytes=int(get_setting("RESULT_CACHE_MAX_MB", 256)) * 1024 * 1024,
+    )
+
+result_cache = get_result_cache()
+
+def finish_run():
+    """Log the rerun total with cache hit rates and, for admins, show this rerun's spans."""
+    cache_stats = result_cache.stats()
+    timing_run.add({"span": "rerun", "ms": timing_run.elapsed_ms(), "cache": cache_stats})
+    if not SHOW_ADMIN:
+        return
+    with st.expander("Performance (admin)"):
+        hit_rate, entries, used_mb, evictions = st.columns(4)
+        hit_rate.metric("Result cache hit rate", f"{cache_stats['hit_rate']:.0%}")
+        entries.metric("Cached entries", cache_stats["entries"])
+        used_mb.metric("Cache size", f"{cache_stats['bytes'] / 1e6:.1f} MB")
+        evictions.metric("Evictions", cache_stats["evictions"])
+
+        spans = pd.DataFrame([s for s in timing_run.spans if s["span"] != "rerun"])
+        st.caption(f"Rerun {timing_run.id}: {timing_run.elapsed_ms():.0f} ms, {len(spans)} spans")
+        if spans.empty:
+            return
+        spans = spans.reindex(columns=list(dict.fromkeys(
+            ["span", "table", "start_ms", "ms", "rows", "payload_bytes"] + list(spans.columns)
+        )))
+        by_stage = spans.groupby(["span", "table"], dropna=False).agg(
+            count=("ms", "size"), total_ms=("ms", "sum"), max_ms=("ms", "max"),
+            rows=("rows", "sum"), payload_bytes=("payload_bytes", "sum"),
+        ).sort_values("total_ms", ascending=False)
+        st.dataframe(by_stage, use_container_width=True)
+        st.dataframe(spans.sort_values("start_ms"), use_container_width=True, hide_index=True)
 
 # ─────────────────────────────
-# Bowling Over Display (Fix 15.9 overs)
+# Optional Local Snapshot (read instead of Supabase while fresh)
 # ─────────────────────────────
-def convert_overs_to_balls(overs_series):
-    """Convert overs like 3.5 to total balls."""
-    overs = overs_series.astype(float).fillna(0)
-    whole = overs.astype(int)
-    decimal = (overs - whole).round(1) * 10
-    return (whole * 6 + decimal).astype(int)
-
-def convert_balls_to_overs(total_balls):
-    """Convert balls (int) to overs in cricket format."""
-    overs = total_balls // 6
-    balls = total_balls % 6
-    return overs + balls / 10
+SNAPSHOT_DIR = get_setting("SNAPSHOT_DIR")
+SNAPSHOT_MAX_AGE_HOURS = float(get_setting("SNAPSHOT_MAX_AGE_HOURS", 24 * 8))
+
+@st.cache_resource
+def get_snapshot_store():
+    if not SNAPSHOT_DIR:
+        return None
+    try:
+        return SnapshotStore(SNAPSHOT_DIR)
+    except ImportError:
+        return None
+
+snapshot_store = get_snapshot_store()
+
+def load_rows(table: str, column: str = None, values: list = None, select: str = "*",
+              filters: dict = None) -> pd.DataFrame:
+    """Read rows from the local snapshot when it is fresh, otherwise from Supabase.
+
+    Rows come back with the table's declared compact dtypes (see schema.py).
+    """
+    from_snapshot = snapshot_store is not None and snapshot_store.is_fresh(table, SNAPSHOT_MAX_AGE_HOURS * 3600)
+    with timing.span("load_rows", table=table, source="snapshot" if from_snapshot else "supabase") as span:
+        if from_snapshot:
+            rows = snapshot_store.read(table, column, values, select=select, filters=filters)
+        else:
+            rows = fetch_rows(read_client, table, column, values, select=select, filters=filters)
+        rows = apply_schema(rows, table)
+        span["rows"] = len(rows)
+    return rows
 
 # ─────────────────────────────
-# Column Reorder Function
+# Pre-aggregated Summary Tables (built weekly by build_summaries.py)
 # ─────────────────────────────
-def reorder_columns(df: pd.DataFrame, desired_order: list) -> pd.DataFrame:
-    actual = [col for col in desired_order if col in df.columns]
-    return df[actual]
+USE_SUMMARY_TABLES = str(get_setting("USE_SUMMARY_TABLES", "")).lower() in ("1", "true", "yes")
+BATTING_TABLE = "player_season_batting" if USE_SUMMARY_TABLES else "player_data_batting"
+BOWLING_TABLE = "player_season_bowling" if USE_SUMMARY_TABLES else "player_data_bowling"
+# Only the columns the tables use are requested
+BATTING_SELECT = select_list(SUMMARY_BATTING_COLUMNS if USE_SUMMARY_TABLES else BATTING_INPUT_COLUMNS)
+BOWLING_SELECT = select_list(SUMMARY_BOWLING_COLUMNS if USE_SUMMARY_TABLES else BOWLING_INPUT_COLUMNS)
+
+def load_team_rows(table: str, select: str, player_ids: list, team_key: tuple) -> pd.DataFrame:
+    """The team's full history in `table`, from the shared cache - season filters never refetch.
+
+    Rows without a season are labelled MISSING_SEASON, so they are one of the season options
+    and "no seasons selected" covers exactly the same rows as "every season selected".
+    """
+    return result_cache.get_or_fetch(
+        (table,) + team_key, lambda: fill_season(load_rows(table, "player_id", player_ids, select=select))
+    )
+
+def in_seasons(df: pd.DataFrame, seasons: tuple = None) -> pd.DataFrame:
+    """Rows of `seasons` (None = all)."""
+    if seasons is None or df.empty:
+        return df
+    return df[df["season"].isin(seasons)]
+
+def batting_agg_from(df: pd.DataFrame, keys: list = None) -> pd.DataFrame:
+    if USE_SUMMARY_TABLES:
+        return unpack_dismissals(df)
+    return batting_player_season(prepare_batting(df), keys)
+
+def bowling_agg_from(df: pd.DataFrame, keys: list = None) -> pd.DataFrame:
+    if USE_SUMMARY_TABLES:
+        return reorder_columns(df, SUMMARY_BOWLING_COLUMNS)
+    return bowling_player_season(prepare_bowling(df), keys)
+
+def with_player_names(df: pd.DataFrame, players: pd.DataFrame) -> pd.DataFrame:
+    """Fill in player_name from the links (merge on player_id) when the rows don't carry it."""
+    if "player_name" in df.columns and not df["player_name"].isna().all():
+        return df
+    return df.drop(columns="player_name", errors="ignore").merge(
+        players[["player_id", "player_name"]].drop_duplicates("player_id"),
+        how="left",
+        on="player_id",
+        validate="many_to_one"
+    )
 
 # ─────────────────────────────
 # Page Header and Description
@@ -89,42 +251,145 @@ st.divider()
 # ─────────────────────────────
 # Season, Grade and Team Selection
 # ─────────────────────────────
-@st.cache_data(ttl=300)
+@st.cache_resource(ttl=300)
 def get_player_links():
     # Minimal change: include player_id so we can fetch *all seasons* for the same players.
-    res = supabase_anon.table("player_links").select(
-        "player_name,team,season,grade,player_url,player_id"
-    ).execute()
-    return pd.DataFrame(res.data)
+    # Paged so the table is never cut off at the PostgREST row limit.
+    return load_rows(
+        "player_links",
+        select="player_name,team,season,grade,player_url,player_id"
+    )
+
+@st.cache_resource(ttl=300)
+def get_links_index() -> dict:
+    """season -> grade -> team -> players, rebuilt whenever get_player_links refreshes."""
+    return build_links_index(get_player_links())
+
+with timing.span("get_player_links"):
+    links_index = get_links_index()
+
+WICKETS_PER_PAGE = int(get_setting("WICKETS_PER_PAGE", 10))
+WICKET_COLUMNS = "id,created_at,match_link,match_id,player_id_bat,player_link_bat,team_bat,player_id_bowl,player_link_bowl,team_bowl,wicket,how_out,how_out_norm"
+
+# Shared as-is between sessions (no per-rerun copy) - treat the result as read-only
+@st.cache_resource(ttl=300)
+def fetch_wickets(player_ids: list, field: str, before: tuple = ()):
+    """Latest WICKETS_PER_PAGE + 1 wickets per player (batting or bowling), newest first.
+
+    `before` holds (player_id, (created_at, id)) cursors; only wickets after that one in
+    (created_at, id) newest-first order are fetched for those players, so wickets sharing
+    a created_at are never skipped. The extra row per player just signals another page.
+    """
+    with timing.span("fetch_wickets", table="wickets", field=field):
+        if not player_ids:
+            return pd.DataFrame()
+        cursors = dict(before)
+        if snapshot_store is not None and snapshot_store.is_fresh("wickets", SNAPSHOT_MAX_AGE_HOURS * 3600):
+            wk_df = apply_schema(snapshot_store.read("wickets", field, player_ids, select=WICKET_COLUMNS), "wickets")
+            if wk_df.empty:
+                return wk_df
+            if cursors:
+                cut_at = wk_df[field].map({player: cursor[0] for player, cursor in cursors.items()})
+                cut_id = wk_df[field].map({player: cursor[1] for player, cursor in cursors.items()})
+                older = (wk_df["created_at"] < cut_at) | ((wk_df["created_at"] == cut_at) & (wk_df["id"] < cut_id))
+                wk_df = wk_df[cut_at.isna() | older]
+            wk_df = (wk_df.sort_values(["created_at", "id"], ascending=False)
+                     .groupby(field).head(WICKETS_PER_PAGE + 1))
+        else:
+            wk_df = apply_schema(
+                fetch_latest(read_client, "wickets", field, player_ids, "created_at",
+                             WICKETS_PER_PAGE + 1, select=WICKET_COLUMNS, before=cursors),
+                "wickets"
+            )
+        if wk_df.empty:
+            return wk_df
+        return wk_df.sort_values(["created_at", "id"], ascending=False, ignore_index=True)
 
-player_links_df = get_player_links()
 
 # Select Season
-seasons = sorted(player_links_df["season"].dropna().unique(), reverse=True)
+seasons = sorted(links_index, reverse=True)
 season = st.selectbox("Select Season", seasons)
 
 # Select Grade based on Season
-grades = sorted(
-    player_links_df[player_links_df["season"] == season]["grade"]
-    .dropna()
-    .unique()
-)
+grades = sorted(links_index.get(season, {}))
 grade = st.selectbox("Select Grade", grades)
 
+mode = st.radio("View", ["Team Report", "Grade Leaderboard"], horizontal=True)
+
+# ─────────────────────────────
+# Grade Leaderboard (every team's players in the season + grade, ranked together)
+# ─────────────────────────────
+def grade_players(season, grade) -> pd.DataFrame:
+    """Player rows for every team in the grade, with a `team` column."""
+    teams_in_grade = links_index.get(season, {}).get(grade, {})
+    if not teams_in_grade:
+        return pd.DataFrame(columns=["team", "player_name", "player_url", "player_id"])
+    return pd.concat(
+        [players.assign(team=team) for team, players in teams_in_grade.items()], ignore_index=True
+    )
+
+def grade_agg(kind: str, season, grade, players: pd.DataFrame) -> pd.DataFrame:
+    """Per-(player, season) aggregate for the whole grade in `season`, held in the shared cache."""
+    table, select, agg_from = {
+        "batting": (BATTING_TABLE, BATTING_SELECT, batting_agg_from),
+        "bowling": (BOWLING_TABLE, BOWLING_SELECT, bowling_agg_from),
+    }[kind]
+
+    def build():
+        # Chunked, parallel in.() queries - a grade is a few hundred to a few thousand players
+        rows = load_rows(table, "player_id", players["player_id"].dropna().unique().tolist(),
+                         select=select, filters={"season": [season]})
+        if rows.empty:
+            return rows
+        return agg_from(with_player_names(rows, players), LEADER_KEYS)
+
+    return result_cache.get_or_fetch((f"{kind}_grade_agg", table, season, grade), build)
+
+def with_team(board: pd.DataFrame, players: pd.DataFrame) -> pd.DataFrame:
+    players = players.drop_duplicates("player_id")
+    team_of = players.set_index(players["player_id"].astype(str))["team"]
+    board = board.assign(team=board["player_id"].astype(str).map(team_of))
+    return board[["player_name", "team"] + [c for c in board.columns if c not in ("player_id", "player_name", "team")]]
+
+if mode == "Grade Leaderboard":
+    min_innings = st.number_input("Minimum innings to be ranked", min_value=1, value=3, step=1)
+    players_in_grade = grade_players(season, grade)
+
+    with st.spinner("Fetching grade data..."):
+        with ThreadPoolExecutor(max_workers=2) as grade_pool:
+            bat_future = grade_pool.submit(timing.in_run(grade_agg), "batting", season, grade, players_in_grade)
+            bowl_future = grade_pool.submit(timing.in_run(grade_agg), "bowling", season, grade, players_in_grade)
+        grade_bat, grade_bowl = bat_future.result(), bowl_future.result()
+
+    st.subheader(f"Batting Leaderboard - {grade} {season}")
+    st.markdown("**Ranked by Average and Strike Rate; percentiles are against every qualified batter in the grade**")
+    if grade_bat.empty:
+        st.info("No batting data for this grade.")
+    else:
+        with timing.span("aggregate", table="batting_leaderboard"):
+            bat_board = with_team(batting_leaderboard(grade_bat, min_innings), players_in_grade)
+        with timing.span("render", table="batting_leaderboard", rows=len(bat_board)):
+            st.dataframe(bat_board.sort_values("Average Rank"), use_container_width=True, hide_index=True)
+
+    st.subheader(f"Bowling Leaderboard - {grade} {season}")
+    st.markdown("**Ranked by Economy and Strike Rate (lower is better)**")
+    if grade_bowl.empty:
+        st.info("No bowling data for this grade.")
+    else:
+        with timing.span("aggregate", table="bowling_leaderboard"):
+            bowl_board = with_team(bowling_leaderboard(grade_bowl, min_innings), players_in_grade)
+        with timing.span("render", table="bowling_leaderboard", rows=len(bowl_board)):
+            st.dataframe(bowl_board.sort_values("Economy Rank"), use_container_width=True, hide_index=True)
+    finish_run()
+    st.stop()
+
 # Select Team based on Season + Grade (and exclude 'BAY')
-teams = sorted(
-    player_links_df[
-        (player_links_df["season"] == season) &
-        (player_links_df["grade"] == grade)
-    ]["team"]
-    .dropna()
-    .unique()
-)
+teams = sorted(links_index.get(season, {}).get(grade, {}))
 teams = [t for t in teams if t != "BAY"]
 team = st.selectbox("Select Team", teams)
 
 # To include BAY replace teams above with this:
-# teams = sorted(player_links_df[player_links_df["season"] == season]["team"].dropna().unique())
+# teams = sorted(links_index.get(season, {}).get(grade, {}))
 # team = st.selectbox("Select Team", teams)
 
 # Maintain state after clicking 'Get Player Data'
@@ -137,77 +402,69 @@ if st.button("Get Player Data"):
 if st.session_state.load_data:
     with st.spinner("Fetching data..."):
         # SAME player selection as before (do not change returned players)
-        selected_links = player_links_df[
-            (player_links_df["season"] == season) &
-            (player_links_df["team"] == team) &
-            (player_links_df["grade"] == grade)
-        ][["player_name", "player_url", "player_id"]].drop_duplicates()
+        selected_links = team_players(links_index, season, grade, team)
 
         # Only change: use player_id to pull *full history* for those players.
         player_ids = selected_links["player_id"].dropna().unique().tolist()
 
-        # ─────────── Batting Data (use player_id to fetch all seasons) ───────────
-        res = supabase_anon.table("player_data_batting").select("*").in_("player_id", player_ids).execute()
-        batting_df = pd.DataFrame(res.data)
+        # ─────────── Fetch all four tables concurrently ───────────
+        # Batting/bowling load the team's full history into the shared cache, so the season
+        # filter below is applied locally and never refetches.
+        # Worker threads get this rerun's script context so the cached fetch_wickets works there.
+        team_key = (season, grade, team, frozenset(player_ids))
+        ctx = get_script_run_ctx()
+        pool = ThreadPoolExecutor(max_workers=4, initializer=lambda: add_script_run_ctx(ctx=ctx))
+        wickets_futures = {
+            "player_id_bat": pool.submit(timing.in_run(fetch_wickets), player_ids, "player_id_bat"),
+            "player_id_bowl": pool.submit(timing.in_run(fetch_wickets), player_ids, "player_id_bowl"),
+        }
+        batting_future = pool.submit(timing.in_run(load_team_rows), BATTING_TABLE, BATTING_SELECT, player_ids, team_key)
+        bowling_future = pool.submit(timing.in_run(load_team_rows), BOWLING_TABLE, BOWLING_SELECT, player_ids, team_key)
+        pool.shutdown(wait=False)
 
-        if not batting_df.empty:
-            # Ensure player_name exists (merge on player_id, not link)
-            if "player_name" not in batting_df.columns or batting_df["player_name"].isna().all():
-                batting_df = batting_df.merge(
-                    selected_links[["player_id", "player_name"]].drop_duplicates(),
-                    how="left",
-                    on="player_id",
-                    validate="many_to_one"
-                )
+        with timing.span("wait", table=BATTING_TABLE):
+            batting_history = batting_future.result()
 
-            # ─────── Filter Section ───────
+        # ─────── Filter Section (season options come from the batting history itself) ───────
+        all_seasons = sorted(batting_history["season"].dropna().unique()) if not batting_history.empty else []
+        if all_seasons:
             st.subheader("Filter Data")
-            # OLD FILTERING METHOD - CHOOSE ONE ONLY - OPTION 1
-            # selected_seasons = st.multiselect("Filter by Season", sorted(batting_df["season"].dropna().unique()), default=sorted(batting_df["season"].dropna().unique()))
+        # OLD FILTERING METHOD - CHOOSE ONE ONLY - OPTION 1
+        # selected_seasons = st.multiselect("Filter by Season", all_seasons, default=all_seasons)
+
+        # NEW FILTERING METHOD  - CHOOSE ONE ONLY - OPTION 2
+        selected_seasons = st.multiselect("Filter by Season", all_seasons) if all_seasons else []
 
-            # NEW FILTERING METHOD  - CHOOSE ONE ONLY - OPTION 2
-            all_seasons = sorted(batting_df["season"].dropna().unique())
-            selected_seasons = st.multiselect("Filter by Season", all_seasons)
+        # Show all seasons by default if none selected
+        season_filter = tuple(sorted(selected_seasons)) or None
+        # END NEW FILTERING METHOD
 
-            # Show all seasons by default if none selected
-            if not selected_seasons:
-                selected_seasons = all_seasons
-            # END NEW FILTERING METHOD
+        # ─────────── Batting Data (use player_id to fetch all seasons) ───────────
+        batting_df = in_seasons(batting_history, season_filter)
 
-            filtered = batting_df[batting_df["season"].isin(selected_seasons)]
+        if not batting_df.empty:
+            # Ensure player_name exists (merge on player_id, not link)
+            batting_df = with_player_names(batting_df, selected_links)
 
-            numeric_fields = ["runs", "balls", "4s", "6s", "innings"]
-            for col in numeric_fields:
-                filtered[col] = pd.to_numeric(filtered[col], errors="coerce").fillna(0)
+            # One additive per-(player, season) table - the tables below only roll it up
+            with timing.span("aggregate", table="batting_agg"):
+                filtered = result_cache.get_or_fetch(
+                    ("batting_agg", BATTING_TABLE, season_filter) + team_key, lambda: batting_agg_from(batting_df)
+                )
 
             # ─────── Table 1: Overall Batting Summary ───────
             st.subheader("Overall Batting Summary")
             st.markdown("**How Out, Average, Strike Rate and Boundaries Per Innings**")
-            overall = filtered.groupby("player_name").agg({
-                "how_out": lambda x: x.value_counts().to_dict(),
-                "4s": "sum", "6s": "sum", "runs": "sum",
-                "balls": "sum", "innings": "sum"
-            }).reset_index()
-
-            dismissal_types = set()
-            for d in overall["how_out"]:
-                dismissal_types.update(d.keys())
-            for dtype in dismissal_types:
-                overall[dtype] = overall["how_out"].apply(lambda x: x.get(dtype, 0))
-            overall.drop(columns="how_out", inplace=True)
-
-            overall["SR"] = ((overall["runs"] / overall["balls"]) * 100).round(2).replace([float("inf"), -float("inf")], 0)
-            overall["Average"] = filtered.groupby("player_name")["runs"].mean().round(2).reset_index(drop=True)
-            overall["% Boundary Runs"] = ((((overall["4s"]*4)+(overall["6s"]*6))/(overall["runs"]))*100).round(2)
-            overall["Avg. boundary per inns."] = ((overall["4s"])+(overall["6s"])) / (overall["innings"]).round(2)
-
-            overall.rename(columns={"innings": "Innings"}, inplace=True)
-
-            st.dataframe(
-                #overall.drop(columns=["runs", "balls", "4s", "6s"]).sort_values("Average", ascending=False),
-                overall.drop(columns=["balls"]).sort_values("Average", ascending=False),
-                use_container_width=True, hide_index=True
-            )
+            with timing.span("aggregate", table="overall_batting"):
+                dismissals = dismissal_types(filtered)
+                overall = overall_batting(filtered, dismissals)
+
+            with timing.span("render", table="overall_batting", rows=len(overall)):
+                st.dataframe(
+                    #overall.drop(columns=["runs", "balls", "4s", "6s"]).sort_values("Average", ascending=False),
+                    overall.drop(columns=["balls"]).sort_values("Average", ascending=False),
+                    use_container_width=True, hide_index=True
+                )
 
             # ─────── Table 2: Season-by-Season Batting Stats ───────
             st.subheader("Season-by-Season Batting Stats")
@@ -216,30 +473,17 @@ if st.session_state.load_data:
             player_options = sorted(filtered["player_name"].dropna().unique())
             selected_players_bat = st.multiselect("Select Players (Batting Table)", player_options, default=[])
 
-            season_df = filtered.copy()
-            if selected_players_bat:
-                season_df = season_df[season_df["player_name"].isin(selected_players_bat)]
-
-            season_df = season_df.groupby(["player_name", "season"]).agg({
-                "how_out": lambda x: x.value_counts().to_dict(),
-                "4s": "sum", "6s": "sum", "runs": "sum",
-                "balls": "sum", "innings": "sum"
-            }).reset_index()
-
-            for dtype in dismissal_types:
-                season_df[dtype] = season_df["how_out"].apply(lambda x: x.get(dtype, 0))
-            season_df.drop(columns="how_out", inplace=True)
-
-            season_df["SR"] = ((season_df["runs"] / season_df["balls"]) * 100).round(2).replace([float("inf"), -float("inf")], 0)
-            season_df["Average"] = filtered.groupby(["player_name", "season"])["runs"].mean().round(2).reset_index(drop=True)
-            season_df["% Boundary Runs"] = ((((season_df["4s"] * 4) + (season_df["6s"] * 6)) / (season_df["runs"]))*100).round(2)
-            season_df["Avg. 4s per inns."] = (season_df["4s"] / season_df["innings"]).round(2)
-            season_df["Avg. 6s per inns."] = (season_df["6s"] / season_df["innings"]).round(2)
-
-            st.dataframe(
-                season_df.drop(columns=["runs", "balls", "4s", "6s"]).sort_values(["player_name", "season"]),
-                use_container_width=True, hide_index=True
-            )
+            with timing.span("aggregate", table="season_batting"):
+                season_df = filtered
+                if selected_players_bat:
+                    season_df = season_df[season_df["player_name"].isin(selected_players_bat)]
+                season_df = season_batting(season_df, dismissals)
+
+            with timing.span("render", table="season_batting", rows=len(season_df)):
+                st.dataframe(
+                    season_df.drop(columns=["runs", "balls", "4s", "6s"]).sort_values(["player_name", "season"]),
+                    use_container_width=True, hide_index=True
+                )
 
             # Batting and Bowling Divider
             st.divider()
@@ -249,108 +493,48 @@ if st.session_state.load_data:
             st.markdown("**Statistics on: Dismissal Types by Bowler**")
 
             # Minimal change: fetch bowling via player_id too (full history), same players
-            res_bowl = supabase_anon.table("player_data_bowling").select("*").in_("player_id", player_ids).execute()
-            bowling_df = pd.DataFrame(res_bowl.data)
+            with timing.span("wait", table=BOWLING_TABLE):
+                bowling_df = in_seasons(bowling_future.result(), season_filter)
+                # Rows with malformed overs (e.g. 3.7) are left out of the bowling tables - say so
+                bad_overs = 0 if USE_SUMMARY_TABLES or bowling_df.empty else int(invalid_overs(bowling_df["overs"]).sum())
+                if bad_overs:
+                    st.warning(f"{bad_overs} bowling row(s) with invalid overs (e.g. 3.7) are left out of these tables.")
 
             if not bowling_df.empty:
-                if "player_name" not in bowling_df.columns or bowling_df["player_name"].isna().all():
-                    bowling_df = bowling_df.merge(
-                        selected_links[["player_id", "player_name"]].drop_duplicates(),
-                        how="left",
-                        on="player_id",
-                        validate="many_to_one"
-                    )
+                bowling_df = with_player_names(bowling_df, selected_links)
 
-                for col in ["innings", "overs", "wickets", "runs_conceded", "maidens", "top_4_w", "bottom_4_w", "bowled", "caught", "lbw", "c_and_b", "stumped", "other_wicket"]:
-                    bowling_df[col] = pd.to_numeric(bowling_df[col], errors="coerce").fillna(0)
-
-                # Create temporary column for bowling economy
-                bowling_df["valid_overs"] = convert_decimal_overs_to_float(bowling_df["overs"])
-                # calculate balls bowled to show overs correctly
-                bowling_df["balls_bowled"] = convert_overs_to_balls(bowling_df["overs"])
-
-                overall_bowl = bowling_df.groupby("player_name").agg({
-                    "innings": "sum", "balls_bowled": "sum", "runs_conceded": "sum",
-                    "wickets": "sum", "top_4_w": "sum",
-                    "bottom_4_w": "sum", "bowled": "sum", "caught": "sum",
-                    "lbw": "sum", "c_and_b": "sum", "stumped": "sum",
-                    "valid_overs": "sum","other_wicket": "sum"
-                }).reset_index()  # include maidens by adding "maidens": "sum" above
-
-                # new economy rate and overs display
-                overall_bowl["Economy"] = (overall_bowl["runs_conceded"] / overall_bowl["valid_overs"]).round(2)
-                overall_bowl["SR"] = (overall_bowl["balls_bowled"] / overall_bowl["wickets"]).round(2)
-                overall_bowl["Overs"] = overall_bowl["balls_bowled"].apply(convert_balls_to_overs)
-                overall_bowl["Avg"] = (overall_bowl["runs_conceded"] / overall_bowl["wickets"]).round(2)
-
-                overall_bowl.rename(columns={
-                    "top_4_w": "Top 4 Wickets", "bottom_4_w": "Tail Wickets",
-                    "c_and_b": "C&B", "other_wicket": "Other","runs_conceded": "Runs Conceded","stumped": "Stumped",
-                    "innings": "Innings", "overs": "Overs", "wickets": "Wickets", "lbw":"LBW","bowled":"Bowled","caught":"Caught"
-                }, inplace=True)
-
-                #### TEST BLOCK COLUMN REORDER
-                desired_bowl_cols = [
-                    "player_name", "Innings", "Overs","Wickets","Avg" ,"Runs Conceded", "Economy",
-                    "SR", "Top 4 Wickets", "Tail Wickets", "Bowled", "Caught", "LBW", "C&B", "Stumped", "Other", "valid_overs", "balls_bowled"
-                ]  # maidens to be added here if included in groupby statement
-
-                overall_bowl = reorder_columns(overall_bowl, desired_bowl_cols)
+                with timing.span("aggregate", table="bowling_agg"):
+                    bowl_agg = result_cache.get_or_fetch(
+                        ("bowling_agg", BOWLING_TABLE, season_filter) + team_key, lambda: bowling_agg_from(bowling_df)
+                    )
+                with timing.span("aggregate", table="overall_bowling"):
+                    overall_bowl = overall_bowling(bowl_agg)
 
                 # Drop the helper cols and show the dataframe
-                st.dataframe(
-                    overall_bowl.drop(columns=["valid_overs","balls_bowled","Runs Conceded"]).sort_values("Wickets", ascending=False),
-                    use_container_width=True, hide_index=True
-                )
+                with timing.span("render", table="overall_bowling", rows=len(overall_bowl)):
+                    st.dataframe(
+                        overall_bowl.drop(columns=["balls_bowled","Runs Conceded"]).sort_values("Wickets", ascending=False),
+                        use_container_width=True, hide_index=True
+                    )
 
                 # ─────── Table 4: Season-by-Season Bowling Summary ───────
                 st.subheader("Season-by-Season Bowling Stats")
                 st.markdown("**Season Based Statistics on: Dismissal Types by Bowler**")
 
-                player_options_bowl = sorted(bowling_df["player_name"].dropna().unique())
+                player_options_bowl = sorted(bowl_agg["player_name"].dropna().unique())
                 selected_players_bowl = st.multiselect("Select Players (Bowling Table)", player_options_bowl, default=[])
 
-                season_bowl = bowling_df.copy()
-                if selected_players_bowl:
-                    season_bowl = season_bowl[season_bowl["player_name"].isin(selected_players_bowl)]
-
-                # Helpers
-                season_bowl["valid_overs"] = convert_decimal_overs_to_float(season_bowl["overs"])
-                season_bowl["balls_bowled"] = convert_overs_to_balls(season_bowl["overs"])
-
-                season_bowl = season_bowl.groupby(["player_name", "season"]).agg({
-                    "innings": "sum", "balls_bowled": "sum", "runs_conceded": "sum",
-                    "wickets": "sum", "top_4_w": "sum",
-                    "bottom_4_w": "sum", "bowled": "sum", "caught": "sum",
-                    "lbw": "sum", "c_and_b": "sum", "stumped": "sum",
-                    "valid_overs": "sum","other_wicket": "sum"
-                }).reset_index()
-                # to include maidens, add "maidens": "sum" in the list above
-
-                # new economy rate and overs display
-                season_bowl["Economy"] = (season_bowl["runs_conceded"] / season_bowl["valid_overs"]).round(2)
-                season_bowl["SR"] = (season_bowl["balls_bowled"] / season_bowl["wickets"]).round(2)
-                season_bowl["Overs"] = season_bowl["balls_bowled"].apply(convert_balls_to_overs)
-                season_bowl["Avg"] = (season_bowl["runs_conceded"] / season_bowl["wickets"]).round(2)
-
-                season_bowl.rename(columns={
-                    "top_4_w": "Top 4 Wickets", "bottom_4_w": "Tail Wickets",
-                    "c_and_b": "C&B", "other_wicket": "Other","runs_conceded": "Runs Conceded","stumped": "Stumped",
-                    "innings": "Innings", "wickets": "Wickets", "lbw":"LBW","bowled":"Bowled","caught":"Caught",
-                }, inplace=True)
-
-                #### TEST BLOCK COLUMN REORDER
-                desired_bowl_season_cols = [
-                    "player_name", "season", "Innings", "Overs", "Wickets","Avg" ,"Runs Conceded", "Economy",
-                    "SR","Top 4 Wickets", "Tail Wickets", "Bowled", "Caught", "LBW", "C&B", "Stumped", "Other", "valid_overs", "balls_bowled"
-                ]  # Include "maidens" here to display if added to the groupby statement
-
-                season_bowl = reorder_columns(season_bowl, desired_bowl_season_cols)
+                with timing.span("aggregate", table="season_bowling"):
+                    season_bowl = bowl_agg
+                    if selected_players_bowl:
+                        season_bowl = season_bowl[season_bowl["player_name"].isin(selected_players_bowl)]
+                    season_bowl = season_bowling(season_bowl)
 
-                st.dataframe(
-                    season_bowl.drop(columns=["valid_overs","balls_bowled","Runs Conceded"]).sort_values(["player_name", "season"]),
-                    use_container_width=True, hide_index=True
-                )
+                with timing.span("render", table="season_bowling", rows=len(season_bowl)):
+                    st.dataframe(
+                        season_bowl.drop(columns=["balls_bowled","Runs Conceded"]).sort_values(["player_name", "season"]),
+                        use_container_width=True, hide_index=True
+                    )
 
 
 # ─────────────────────────────
@@ -360,98 +544,105 @@ if st.session_state.load_data:
     st.divider()
     st.subheader("Wickets - Batting And Bowling Wicket Videos")
 
-    @st.cache_data(ttl=300)
-    def fetch_wickets(player_ids: list, field: str):
-        """Fetch wickets for given players (batting or bowling)."""
-        if not player_ids:
-            return pd.DataFrame()
-        sel_cols = "id,created_at,match_link,match_id,player_id_bat,player_link_bat,team_bat,player_id_bowl,player_link_bowl,team_bowl,wicket,how_out,how_out_norm"
-        res = (
-            supabase_anon.table("wickets")
-            .select(sel_cols)
-            .in_(field, player_ids)
-            .order("created_at", desc=True)
-            .execute()
-        )
-        return pd.DataFrame(res.data)
+    # CSS for nice chip layout (sent once with each tab's HTML block)
+    WICKET_CSS = """
+    <style>
+    .wicket-container {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 0.4rem;
+        margin: 0.3rem 0 1rem 0.5rem;
+    }
+    .wicket-chip {
+        background-color: #f8f9fa;
+        border: 1px solid #d0d0d0;
+        border-radius: 8px;
+        padding: 0.3rem 0.6rem;
+        font-size: 0.9rem;
+        white-space: nowrap;
+        text-decoration: none;
+        color: #333;
+    }
+    .wicket-chip:hover {
+        background-color: #e9ecef;
+        border-color: #adb5bd;
+    }
+    .wicket-empty {
+        color: rgba(49, 51, 63, 0.6);
+        font-size: 0.875rem;
+        margin: 0.3rem 0 1rem 0;
+    }
+    </style>
+    """
+
+    if "wicket_cursors" not in st.session_state:
+        st.session_state.wicket_cursors = {}
+
+    def next_cursors(page: pd.DataFrame, field: str) -> tuple:
+        """(player_id, (created_at, id)) of the oldest shown wicket, for players with another page."""
+        counts = page.groupby(field).size()
+        more = counts[counts > WICKETS_PER_PAGE].index
+        shown = page[page[field].isin(more)].groupby(field).nth(WICKETS_PER_PAGE - 1)
+        return tuple(zip(shown[field], zip(shown["created_at"], shown["id"])))
 
     def render_wicket_list(title: str, field: str, players_df: pd.DataFrame):
-        """Render a tidy inline button list per player."""
+        """Render a tidy inline button list per player as a single HTML block."""
         st.markdown(f"### {title}")
 
         if players_df.empty:
             st.info("No players found.")
             return
 
-        ids = players_df["player_id"].dropna().unique().tolist()
-        wk_df = fetch_wickets(ids, field)
-        if wk_df.empty:
+        # First page comes from the concurrent fetch, "show more" pages from stored cursors
+        state_key = f"{field}|{season}|{grade}|{team}"
+        pages = [wickets_futures[field].result()]
+        for before in st.session_state.wicket_cursors.get(state_key, []):
+            pages.append(fetch_wickets([pid for pid, _ in before], field, before))
+        if pages[0].empty:
             st.info("No wicket videos found for these players.")
             return
+        cursors = next_cursors(pages[-1], field) if not pages[-1].empty else ()
+
+        # Drop each page's look-ahead row, then partition once by player
+        wk_df = pd.concat(
+            [page.groupby(field).head(WICKETS_PER_PAGE) for page in pages if not page.empty],
+            ignore_index=True
+        ).sort_values(["created_at", "id"], ascending=False)
 
         # Normalise labels
-        wk_df["how_out_label"] = wk_df["how_out_norm"].fillna("unknown")
-        wk_df.loc[wk_df["how_out_label"].eq("unknown"), "how_out_label"] = wk_df["how_out"].fillna("unknown")
+        labels = wk_df["how_out_norm"].astype(object).fillna("unknown")
+        labels = labels.mask(labels.eq("unknown"), wk_df["how_out"].astype(object).fillna("unknown")).replace("", "unknown")
+        latest = wk_df.groupby(field).cumcount().eq(0)
+        wk_df = wk_df.assign(how_out_label=labels.where(~latest, labels + " (latest)"))
+        chips = (
+            '<a href="' + wk_df["wicket"].astype(str).map(html.escape) + '" target="_blank" rel="noopener" class="wicket-chip">'
+            + wk_df["how_out_label"].astype(str).map(html.escape) + '</a>'
+        )
+        chips_by_player = chips.groupby(wk_df[field]).agg(" ".join)
 
         players_sorted = players_df.dropna().sort_values("player_name")
-
-        # CSS for nice chip layout
-        st.markdown("""
-        <style>
-        .wicket-container {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.4rem;
-            margin: 0.3rem 0 1rem 0.5rem;
-        }
-        .wicket-chip {
-            background-color: #f8f9fa;
-            border: 1px solid #d0d0d0;
-            border-radius: 8px;
-            padding: 0.3rem 0.6rem;
-            font-size: 0.9rem;
-            white-space: nowrap;
-            text-decoration: none;
-            color: #333;
-        }
-        .wicket-chip:hover {
-            background-color: #e9ecef;
-            border-color: #adb5bd;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        for _, rowp in players_sorted.iterrows():
-            pid = rowp["player_id"]
-            pname = rowp["player_name"]
-            sub = wk_df[wk_df[field] == pid].copy()
-
-            st.markdown(f"**{pname}**")
-
-            if sub.empty:
-                st.caption("— no videos —")
-                continue
-
-            sub = sub.sort_values("created_at", ascending=False)
-            chips = []
-            for i, rec in enumerate(sub.itertuples(), start=1):
-                label = rec.how_out_label or "unknown"
-                if i == 1:
-                    label += " (latest)"
-                chips.append(
-                    f'<a href="{rec.wicket}" target="_blank" rel="noopener" class="wicket-chip">{label}</a>'
-                )
-
-            html_block = f'<div class="wicket-container">{" ".join(chips)}</div>'
-            st.markdown(html_block, unsafe_allow_html=True)
+        parts = [WICKET_CSS]
+        for pid, pname in zip(players_sorted["player_id"], players_sorted["player_name"]):
+            parts.append(f"<p><strong>{html.escape(str(pname))}</strong></p>")
+            if pid in chips_by_player.index:
+                parts.append(f'<div class="wicket-container">{chips_by_player[pid]}</div>')
+            else:
+                parts.append('<div class="wicket-empty">— no videos —</div>')
+        st.markdown("".join(parts), unsafe_allow_html=True)
+
+        if cursors and st.button("Show more", key=f"more_{field}"):
+            st.session_state.wicket_cursors.setdefault(state_key, []).append(cursors)
+            st.rerun()
 
     # Use same player list you already have
-    team_players = selected_links[["player_id", "player_name"]].drop_duplicates()
+    wicket_players = selected_links[["player_id", "player_name"]].drop_duplicates()
 
     tab_bat, tab_bowl = st.tabs(["Batting Wickets", "Bowling Wickets"])
-    with tab_bat:
-        render_wicket_list("Batting Wickets", "player_id_bat", team_players)
-    with tab_bowl:
-        render_wicket_list("Bowling Wickets", "player_id_bowl", team_players)
+    with tab_bat, timing.span("render_wickets", table="wickets", field="player_id_bat"):
+        render_wicket_list("Batting Wickets", "player_id_bat", wicket_players)
+    with tab_bowl, timing.span("render_wickets", table="wickets", field="player_id_bowl"):
+        render_wicket_list("Bowling Wickets", "player_id_bowl", wicket_players)
+
+finish_run()
 
 
@@ -0,0 +1,200 @@
+"""Time the app's hot paths on synthetic data and check them against a stored baseline.
+
+Full script reruns go through Streamlit's AppTest with the Supabase client replaced by
+fake_supabase.FakeSupabase (optionally with per-request latency); the aggregation
+functions are also timed on their own.
+
+    python benchmarks/bench_app.py
+    python benchmarks/bench_app.py --teams 20 --latency 0.03 --save benchmarks/baselines/default.json
+    python benchmarks/bench_app.py --compare benchmarks/baselines/default.json --tolerance 0.3
+
+--compare exits with status 1 when a timing is slower than its baseline by more than
+--tolerance (and by more than --min-delta seconds, so tiny timings don't flap).
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_wire_format import measure  # noqa: E402
+from fake_supabase import FakeSupabase  # noqa: E402
+from synthetic import Scale, generate  # noqa: E402
+
+from links_index import build_links_index  # noqa: E402
+from schema import apply_schema  # noqa: E402
+from stats_engine import (  # noqa: E402
+    LEADER_KEYS, batting_leaderboard, batting_player_season, bowling_leaderboard, bowling_player_season,
+    overall_batting, overall_bowling, prepare_batting, prepare_bowling, season_batting, season_bowling
+)
+
+APP = os.path.join(ROOT, "app.py")
+# Settings that would change what the app reads - the benchmark always uses the defaults
+APP_SETTINGS = ["SNAPSHOT_DIR", "USE_SUMMARY_TABLES", "WIRE_FORMAT", "TIMING_LOG", "ADMIN_PANEL"]
+
+
+# ─────────────────────────────
+# Isolated Aggregation Timings
+# ─────────────────────────────
+def bench_aggregation(tables: dict, repeat: int) -> dict:
+    links = apply_schema(tables["player_links"], "player_links")
+    batting = apply_schema(tables["player_data_batting"], "player_data_batting")
+    bowling = apply_schema(tables["player_data_bowling"], "player_data_bowling")
+    bat_agg = batting_player_season(prepare_batting(batting))
+    bowl_agg = bowling_player_season(prepare_bowling(bowling))
+    bat_leader = batting_player_season(prepare_batting(batting), LEADER_KEYS)
+    bowl_leader = bowling_player_season(prepare_bowling(bowling), LEADER_KEYS)
+
+    cases = {
+        "links.build_links_index": lambda: build_links_index(links),
+        "agg.batting_player_season": lambda: batting_player_season(prepare_batting(batting)),
+        "agg.overall_batting": lambda: overall_batting(bat_agg),
+        "agg.season_batting": lambda: season_batting(bat_agg),
+        "agg.bowling_player_season": lambda: bowling_player_season(prepare_bowling(bowling)),
+        "agg.overall_bowling": lambda: overall_bowling(bowl_agg),
+        "agg.season_bowling": lambda: season_bowling(bowl_agg),
+        "agg.batting_leaderboard": lambda: batting_leaderboard(bat_leader, 3),
+        "agg.bowling_leaderboard": lambda: bowling_leaderboard(bowl_leader, 3),
+    }
+    return {name: measure(fn, repeat) for name, fn in cases.items()}
+
+
+# ─────────────────────────────
+# Full Rerun Timings (AppTest)
+# ─────────────────────────────
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def check(at):
+    if at.exception:
+        raise RuntimeError(f"app raised: {at.exception[0].value}")
+    return at
+
+
+def bench_app(client: FakeSupabase, repeat: int, timeout: float) -> dict:
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    import supabase_client
+    supabase_client.create_pooled_client = lambda *args, **kwargs: client
+
+    def fresh_app():
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        at = AppTest.from_file(APP, default_timeout=timeout)
+        at.session_state["authenticated"] = True
+        return at
+
+    samples = {name: [] for name in ["app.first_render", "app.team_load", "app.warm_rerun",
+                                     "app.season_filter", "app.grade_leaderboard"]}
+    requests = {name: [] for name in samples}
+    for _ in range(repeat):
+        at = fresh_app()
+        steps = [
+            ("app.first_render", lambda: check(at.run())),
+            ("app.team_load", lambda: check(at.button[0].click().run())),
+            ("app.warm_rerun", lambda: check(at.run())),
+            ("app.season_filter", lambda: check(at.multiselect[0].select(at.multiselect[0].options[0]).run())),
+            ("app.grade_leaderboard", lambda: check(at.radio[0].set_value("Grade Leaderboard").run())),
+        ]
+        for name, step in steps:
+            before = client.requests
+            samples[name].append(timed(step))
+            requests[name].append(client.requests - before)
+
+    return {
+        name: {"seconds": round(min(times), 4), "median_s": round(statistics.median(times), 4),
+               "requests": max(requests[name])}
+        for name, times in samples.items()
+    }
+
+
+# ─────────────────────────────
+# Baselines
+# ─────────────────────────────
+def compare(results: dict, baseline: dict, tolerance: float, min_delta: float) -> list:
+    """Names whose time regressed beyond `tolerance` (relative) and `min_delta` (seconds)."""
+    rows, regressions = [], []
+    for name, base in baseline["results"].items():
+        if name not in results:
+            continue
+        now, before = results[name]["seconds"], base["seconds"]
+        change = (now - before) / before if before else 0.0
+        regressed = change > tolerance and now - before > min_delta
+        rows.append({"benchmark": name, "baseline_s": before, "now_s": now,
+                     "change": f"{change:+.0%}", "status": "REGRESSED" if regressed else "ok"})
+        if regressed:
+            regressions.append(name)
+    if rows:
+        print(pd.DataFrame(rows).to_string(index=False))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    defaults = Scale()
+    for field in ("seasons", "grades", "teams", "players", "innings", "seed"):
+        parser.add_argument(f"--{field}", type=int, default=getattr(defaults, field))
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per fake Supabase request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency, up to this many seconds")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=120, help="AppTest timeout per rerun")
+    parser.add_argument("--skip-app", action="store_true", help="only time the aggregation functions")
+    parser.add_argument("--save", help="write the results as a baseline JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to check the results against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--min-delta", type=float, default=0.005)
+    args = parser.parse_args()
+
+    scale = Scale(args.seasons, args.grades, args.teams, args.players, args.innings, args.seed)
+    tables = generate(scale)
+    print("rows:", {name: len(df) for name, df in tables.items()})
+
+    results = bench_aggregation(tables, args.repeat)
+    if not args.skip_app:
+        for name in APP_SETTINGS:
+            os.environ.pop(name, None)
+        os.environ.update(APP_PASSWORD="bench", SUPABASE_URL="http://fake.supabase", SUPABASE_ANON_KEY="bench")
+        client = FakeSupabase(tables, latency=args.latency, jitter=args.jitter)
+        results.update(bench_app(client, args.repeat, args.timeout))
+
+    print(pd.DataFrame(results).T.to_string())
+
+    report = {
+        "meta": {
+            "scale": asdict(scale), "latency": args.latency, "jitter": args.jitter, "repeat": args.repeat,
+            "rows": {name: len(df) for name, df in tables.items()},
+            "python": platform.python_version(), "pandas": pd.__version__,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline["meta"]["scale"] != report["meta"]["scale"] or baseline["meta"]["latency"] != args.latency:
+            print("warning: baseline was recorded at a different scale or latency")
+        regressions = compare(results, baseline, args.tolerance, args.min_delta)
+        if regressions:
+            print("Regressed:", ", ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
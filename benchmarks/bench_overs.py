@@ -0,0 +1,116 @@
+"""Compare the integer-ball overs functions with the float helpers they replaced.
+
+Times prepare-style conversion (notation -> balls), the per-bowler rollup maths and the
+display conversion on a few million innings rows, and checks both give the same balls.
+
+    python benchmarks/bench_overs.py --rows 5000000
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_wire_format import measure  # noqa: E402
+from overs import economy, overs_notation, parse_overs, strike_rate  # noqa: E402
+
+
+# ─────────────────────────────
+# Previous Float Helpers (as they were in stats_engine)
+# ─────────────────────────────
+def convert_decimal_overs_to_float(overs_series):
+    overs_series = overs_series.astype(float).fillna(0)
+    full_overs = overs_series.astype(int)
+    balls = ((overs_series - full_overs) * 10).round().astype(int)
+    return full_overs + (balls / 6)
+
+
+def convert_overs_to_balls(overs_series):
+    overs = overs_series.astype(float).fillna(0)
+    whole = overs.astype(int)
+    decimal = (overs - whole).round(1) * 10
+    return (whole * 6 + decimal).astype(int)
+
+
+def convert_balls_to_overs(total_balls):
+    overs = total_balls // 6
+    balls = total_balls % 6
+    return overs + balls / 10
+
+
+def old_pipeline(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.assign(valid_overs=convert_decimal_overs_to_float(df["overs"]),
+                   balls_bowled=convert_overs_to_balls(df["overs"]))
+    totals = df.groupby("player_id")[["valid_overs", "balls_bowled", "runs_conceded", "wickets"]].sum()
+    return pd.DataFrame({
+        "Economy": (totals["runs_conceded"] / totals["valid_overs"]).round(2),
+        "SR": (totals["balls_bowled"] / totals["wickets"]).round(2),
+        "Overs": convert_balls_to_overs(totals["balls_bowled"]),
+    })
+
+
+def new_pipeline(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.assign(balls_bowled=parse_overs(df["overs"]))
+    totals = df.groupby("player_id")[["balls_bowled", "runs_conceded", "wickets"]].sum()
+    return pd.DataFrame({
+        "Economy": economy(totals["runs_conceded"], totals["balls_bowled"]).round(2),
+        "SR": strike_rate(totals["balls_bowled"], totals["wickets"]).round(2),
+        "Overs": overs_notation(totals["balls_bowled"]),
+    })
+
+
+def bowling_rows(n: int, players: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    balls = rng.integers(0, 61, n)
+    return pd.DataFrame({
+        "player_id": rng.integers(1, players + 1, n),
+        "overs": balls // 6 + (balls % 6) / 10,
+        "runs_conceded": rng.poisson(balls * 0.85),
+        "wickets": rng.binomial(balls // 12, 0.18),
+    })
+
+
+def run(rows: int, players: int, repeat: int) -> list:
+    df = bowling_rows(rows, players)
+    if not (convert_overs_to_balls(df["overs"]) == parse_overs(df["overs"])).all():
+        raise AssertionError("old and new ball counts differ")
+    cases = [
+        ("notation -> balls", lambda: convert_overs_to_balls(df["overs"]), lambda: parse_overs(df["overs"])),
+        ("notation -> float overs + balls",
+         lambda: (convert_decimal_overs_to_float(df["overs"]), convert_overs_to_balls(df["overs"])),
+         lambda: parse_overs(df["overs"])),
+        ("prepare + rollup + rates", lambda: old_pipeline(df), lambda: new_pipeline(df)),
+    ]
+    results = []
+    for name, old, new in cases:
+        before, after = measure(old, repeat), measure(new, repeat)
+        results.append({
+            "case": name, "rows": rows,
+            "old_s": before["seconds"], "new_s": after["seconds"],
+            "speedup": round(before["seconds"] / after["seconds"], 2) if after["seconds"] else None,
+            "old_peak_mb": before["peak_mb"], "new_peak_mb": after["peak_mb"],
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--players", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.players, args.repeat)
+    print(pd.DataFrame(results).to_string(index=False))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Compare JSON, CSV and Arrow responses for the batting table against a local stub server.
+
+The stub speaks just enough PostgREST (select is ignored; id=gt.N, limit and Accept are
+honoured) for supabase_fetch.fetch_rows to page through it with wire_format.RestClient.
+
+    python benchmarks/bench_wire_format.py --rows 200000
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from supabase_fetch import fetch_rows  # noqa: E402
+from wire_format import ACCEPT, RestClient, decode  # noqa: E402
+
+FORMATS = ["json", "csv", "arrow"]
+
+
+def batting_rows(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "id": np.arange(n),
+        "player_id": rng.integers(1, 2000, n),
+        "player_name": pd.Series(rng.integers(1, 2000, n)).map("Player {}".format),
+        "season": rng.choice(["2021/22", "2022/23", "2023/24", "2024/25"], n),
+        "how_out": rng.choice(["bowled", "caught", "lbw", "not out", "run out"], n),
+        "runs": rng.integers(0, 120, n),
+        "balls": rng.integers(0, 150, n),
+        "4s": rng.integers(0, 12, n),
+        "6s": rng.integers(0, 5, n),
+        "innings": 1,
+    })
+
+
+def encode(df: pd.DataFrame, fmt: str) -> bytes:
+    if fmt == "json":
+        return json.dumps(df.to_dict("records")).encode()
+    if fmt == "csv":
+        return df.to_csv(index=False).encode()
+    sink = io.BytesIO()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def stub_server(df: pd.DataFrame, arrow: bool = True) -> ThreadingHTTPServer:
+    """PostgREST stand-in on a free local port. Pages are encoded once and reused."""
+    encoded = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            params = dict(parse_qsl(urlparse(self.path).query))
+            accept = self.headers.get("Accept", ACCEPT["json"])
+            fmt = next((f for f, mime in ACCEPT.items() if mime == accept), "json")
+            if fmt == "arrow" and not arrow:
+                self.send_response(406)
+                self.end_headers()
+                return
+            start = int(params["id"][3:]) + 1 if params.get("id", "").startswith("gt.") else 0
+            limit = int(params.get("limit", len(df)))
+            cache_key = (fmt, start, limit)
+            if cache_key not in encoded:
+                encoded[cache_key] = encode(df.iloc[start:start + limit], fmt)
+            body = encoded[cache_key]
+            self.send_response(200)
+            self.send_header("Content-Type", ACCEPT[fmt])
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def measure(fn, repeat: int) -> dict:
+    """Best wall time over `repeat` runs and the Python-heap peak of one run."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": round(min(times), 4), "peak_mb": round(peak / 1e6, 1)}
+
+
+def run(rows: int, page_size: int, repeat: int) -> list:
+    df = batting_rows(rows)
+    server = stub_server(df)
+    url = f"http://127.0.0.1:{server.server_port}"
+    results = []
+    try:
+        for fmt in FORMATS:
+            client = RestClient(url, "anon", fmt=fmt)
+            body = client.http.get(f"{url}/player_data_batting", headers={"Accept": ACCEPT[fmt]}).content
+            decode_stats = measure(lambda: decode(body, ACCEPT[fmt], "player_data_batting"), repeat)
+            fetch_stats = measure(
+                lambda: fetch_rows(client, "player_data_batting", page_size=page_size), repeat
+            )
+            results.append({
+                "format": fmt, "rows": rows, "payload_mb": round(len(body) / 1e6, 1),
+                "decode_s": decode_stats["seconds"], "decode_peak_mb": decode_stats["peak_mb"],
+                "fetch_s": fetch_stats["seconds"], "fetch_peak_mb": fetch_stats["peak_mb"],
+            })
+    finally:
+        server.shutdown()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.page_size, args.repeat)
+    print(pd.DataFrame(results).to_string(index=False))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
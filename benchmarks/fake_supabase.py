@@ -0,0 +1,163 @@
+"""In-memory stand-in for the Supabase client, backed by DataFrames.
+
+Supports the query builder calls the app makes (table/select/in_/eq/gt/lt/or_/order/limit/execute)
+and returns list-of-dict pages like PostgREST's JSON. Each request can sleep for an injected
+latency, which releases the GIL just like waiting on the network, so the app's thread pools
+overlap requests as they would against the real service. Pages are capped at max_rows,
+like PostgREST's max-rows setting.
+"""
+import json
+import random
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+
+class FakeResponse:
+    def __init__(self, data: list):
+        self.data = data
+
+
+class FakeQuery:
+    def __init__(self, client, table: str):
+        self.client = client
+        self.table = table
+        self.columns = None
+        self.filters = []
+        self.order_by = []
+        self.count = None
+
+    def select(self, columns: str):
+        self.columns = None if columns.strip() == "*" else [c.strip().strip('"') for c in columns.split(",")]
+        return self
+
+    def in_(self, column: str, values: list):
+        self.filters.append((column, "in", list(values)))
+        return self
+
+    def eq(self, column: str, value):
+        self.filters.append((column, "eq", value))
+        return self
+
+    def gt(self, column: str, value):
+        self.filters.append((column, "gt", value))
+        return self
+
+    def lt(self, column: str, value):
+        self.filters.append((column, "lt", value))
+        return self
+
+    def or_(self, filters: str):
+        self.filters.append((None, "or", filters))
+        return self
+
+    def order(self, column: str, desc: bool = False):
+        self.order_by.append((column, desc))
+        return self
+
+    def limit(self, count: int):
+        self.count = count
+        return self
+
+    def execute(self) -> FakeResponse:
+        return self.client.run(self)
+
+
+class FakeSupabase:
+    """Answers queries from `tables` (name -> DataFrame).
+
+    latency: seconds slept per request (plus up to `jitter` more).
+    serialize: round-trip each page through JSON so decoding cost matches the real client.
+    """
+
+    def __init__(self, tables: dict, latency: float = 0.0, jitter: float = 0.0,
+                 max_rows: int = 1000, serialize: bool = True):
+        self.tables = tables
+        self.latency = latency
+        self.jitter = jitter
+        self.max_rows = max_rows
+        self.serialize = serialize
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def run(self, query: FakeQuery) -> FakeResponse:
+        with self._lock:
+            self.requests += 1
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.random() * self.jitter)
+
+        df = self.tables[query.table]
+        mask = np.ones(len(df), dtype=bool)
+        for column, op, value in query.filters:
+            mask &= _tree_mask(df, "or", _split(value)) if op == "or" else _compare(df[column], op, value)
+        rows = df[mask]
+        if query.order_by:
+            rows = rows.sort_values([c for c, _ in query.order_by],
+                                    ascending=[not desc for _, desc in query.order_by], kind="stable")
+        rows = rows.iloc[:min(query.count or self.max_rows, self.max_rows)]
+        if query.columns is not None:
+            rows = rows[[c for c in query.columns if c in rows.columns]]
+
+        data = rows.astype(object).where(rows.notna(), None).to_dict("records")
+        if self.serialize:
+            data = json.loads(json.dumps(data, default=_json_default))
+        return FakeResponse(data)
+
+
+def _compare(col: pd.Series, op: str, value) -> np.ndarray:
+    if op == "in":
+        return col.isin(value).to_numpy()
+    if op == "eq":
+        return (col == value).to_numpy()
+    if op == "gt":
+        return (col > value).to_numpy()
+    return (col < value).to_numpy()
+
+
+def _split(tree: str) -> list:
+    """Split a PostgREST logic tree at its top-level commas (outside parentheses and quotes)."""
+    parts, depth, quoted, escaped, start = [], 0, False, False, 0
+    for i, ch in enumerate(tree):
+        if escaped:
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif ch == '"':
+            quoted = not quoted
+        elif not quoted and ch in "()":
+            depth += 1 if ch == "(" else -1
+        elif not quoted and ch == "," and depth == 0:
+            parts.append(tree[start:i])
+            start = i + 1
+    parts.append(tree[start:])
+    return parts
+
+
+def _tree_mask(df: pd.DataFrame, logic: str, terms: list) -> np.ndarray:
+    """Evaluate and(...) / or(...) over `terms` such as created_at.lt."2024-..." or id.eq.5."""
+    masks = []
+    for term in terms:
+        if term.startswith(("and(", "or(")):
+            inner = term[term.index("(") + 1:-1]
+            masks.append(_tree_mask(df, term[:term.index("(")], _split(inner)))
+            continue
+        column, op, value = term.split(".", 2)
+        if value.startswith('"'):
+            value = value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+        if pd.api.types.is_numeric_dtype(df[column]):
+            value = pd.to_numeric(value)
+        masks.append(_compare(df[column], op, value))
+    return np.logical_and.reduce(masks) if logic == "and" else np.logical_or.reduce(masks)
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    raise TypeError(f"Not JSON serializable: {type(value)}")
@@ -0,0 +1,140 @@
+"""Synthetic player_links / batting / bowling / wickets tables at a configurable scale.
+
+Players belong to a club (team) and move between its grades and seasons, so the same
+player_id appears across seasons the way it does in the real data. Everything is
+generated with numpy in one pass per table.
+
+    tables = generate(Scale(seasons=4, grades=3, teams=12, players=14, innings=8))
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+HOW_OUT = ["bowled", "caught", "lbw", "not out", "run out", "stumped", "c & b"]
+HOW_OUT_P = [0.18, 0.45, 0.12, 0.13, 0.06, 0.03, 0.03]
+WICKET_TYPES = ["bowled", "caught", "lbw", "c_and_b", "stumped", "other_wicket"]
+
+
+@dataclass
+class Scale:
+    seasons: int = 4
+    grades: int = 3
+    teams: int = 12
+    players: int = 14   # per team, grade and season
+    innings: int = 8    # mean innings per player and season
+    seed: int = 0
+
+    @property
+    def links(self) -> int:
+        return self.seasons * self.grades * self.teams * self.players
+
+
+def season_names(count: int, last: int = 2025) -> list:
+    return [f"{y - 1}/{str(y)[2:]}" for y in range(last - count + 1, last + 1)]
+
+
+def team_names(count: int) -> list:
+    # BAY is always present - the app hides it from the team picker
+    return ["BAY"] + [f"T{i:02d}" for i in range(1, count)]
+
+
+def player_links(scale: Scale, rng: np.random.Generator) -> pd.DataFrame:
+    """Each club has a pool of ~1.5x the players it fields; every season it picks from it."""
+    seasons, teams = season_names(scale.seasons), team_names(scale.teams)
+    grades = [f"{i + 1}{'st' if i == 0 else 'nd' if i == 1 else 'rd' if i == 2 else 'th'} Grade"
+              for i in range(scale.grades)]
+    pool = int(scale.players * scale.grades * 1.5)
+
+    frames = []
+    for season in seasons:
+        for t, team in enumerate(teams):
+            picked = rng.choice(pool, size=scale.players * scale.grades, replace=False)
+            frames.append(pd.DataFrame({
+                "season": season,
+                "team": team,
+                "grade": np.repeat(grades, scale.players),
+                "player_id": t * pool + picked + 1,
+            }))
+    links = pd.concat(frames, ignore_index=True)
+    links["player_name"] = "Player " + links["player_id"].astype(str)
+    links["player_url"] = "https://play.cricket/player/" + links["player_id"].astype(str)
+    links.insert(0, "id", np.arange(1, len(links) + 1))
+    return links
+
+
+def batting(links: pd.DataFrame, scale: Scale, rng: np.random.Generator) -> pd.DataFrame:
+    counts = rng.poisson(scale.innings, len(links))
+    rows = links.loc[links.index.repeat(counts), ["player_id", "player_name", "season"]].reset_index(drop=True)
+    n = len(rows)
+    runs = np.minimum(rng.geometric(1 / 22, n) - 1, 250)
+    balls = np.maximum(runs * rng.uniform(0.6, 1.5, n), (runs > 0) * 1).astype(int)
+    fours = rng.binomial(runs // 4, 0.35)
+    sixes = rng.binomial(runs // 6, 0.06)
+    return rows.assign(
+        id=np.arange(1, n + 1),
+        how_out=rng.choice(HOW_OUT, n, p=HOW_OUT_P),
+        runs=runs, balls=balls, **{"4s": fours, "6s": sixes}, innings=1,
+    )
+
+
+def bowling(links: pd.DataFrame, scale: Scale, rng: np.random.Generator) -> pd.DataFrame:
+    bowlers = links[rng.random(len(links)) < 0.55]
+    counts = rng.poisson(scale.innings * 0.8, len(bowlers))
+    rows = bowlers.loc[bowlers.index.repeat(counts), ["player_id", "player_name", "season"]].reset_index(drop=True)
+    n = len(rows)
+    whole, part = rng.integers(0, 11, n), rng.integers(0, 6, n)
+    balls = whole * 6 + part
+    wickets = np.minimum(rng.binomial(np.maximum(balls // 12, 0), 0.18), 10)
+    by_type = rng.multinomial(wickets, [0.25, 0.5, 0.15, 0.04, 0.03, 0.03])
+    top = rng.binomial(wickets, 0.45)
+    return rows.assign(
+        id=np.arange(1, n + 1),
+        innings=1,
+        overs=whole + part / 10,
+        wickets=wickets,
+        runs_conceded=rng.poisson(balls * 0.85),
+        maidens=rng.binomial(whole, 0.1),
+        top_4_w=top,
+        bottom_4_w=wickets - top,
+        **{name: by_type[:, i] for i, name in enumerate(WICKET_TYPES)},
+    )
+
+
+def wickets(links: pd.DataFrame, bat: pd.DataFrame, rng: np.random.Generator, video_share: float = 0.4) -> pd.DataFrame:
+    """Wicket videos for a share of the dismissals, each credited to a random bowler."""
+    out = bat[(bat["how_out"] != "not out") & (rng.random(len(bat)) < video_share)].reset_index(drop=True)
+    n = len(out)
+    team_of = links.drop_duplicates("player_id").set_index("player_id")["team"]
+    bowler_ids = links["player_id"].unique()
+    bowler = rng.choice(bowler_ids, n)
+    created = pd.Timestamp("2020-10-01") + pd.to_timedelta(rng.integers(0, 5 * 365 * 24 * 3600, n), unit="s")
+    match_id = rng.integers(10_000, 99_999, n)
+    return pd.DataFrame({
+        "id": np.arange(1, n + 1),
+        "created_at": created.strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+        "match_link": "https://play.cricket/match/" + pd.Series(match_id).astype(str),
+        "match_id": match_id,
+        "player_id_bat": out["player_id"],
+        "player_link_bat": "https://play.cricket/player/" + out["player_id"].astype(str),
+        "team_bat": out["player_id"].map(team_of).to_numpy(),
+        "player_id_bowl": bowler,
+        "player_link_bowl": "https://play.cricket/player/" + pd.Series(bowler).astype(str),
+        "team_bowl": pd.Series(bowler).map(team_of).to_numpy(),
+        "wicket": "https://video.example/w/" + pd.Series(np.arange(1, n + 1)).astype(str),
+        "how_out": out["how_out"],
+        "how_out_norm": out["how_out"].where(rng.random(n) < 0.8),
+    })
+
+
+def generate(scale: Scale = Scale()) -> dict:
+    """All four tables as DataFrames, keyed by Supabase table name."""
+    rng = np.random.default_rng(scale.seed)
+    links = player_links(scale, rng)
+    bat = batting(links, scale, rng)
+    return {
+        "player_links": links,
+        "player_data_batting": bat,
+        "player_data_bowling": bowling(links, scale, rng),
+        "wickets": wickets(links, bat, rng),
+    }
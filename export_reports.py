@@ -0,0 +1,226 @@
+"""Batch job: write every team's report tables to files, without Streamlit.
+
+For each season / grade / team in player_links the four tables the app shows
+(overall and season-by-season, batting and bowling) are computed with stats_engine
+and written to <out>/<season>/<grade>/<team>/<table>.<format>, or to one workbook
+per team for xlsx (needs openpyxl).
+
+Each table is read once in bulk and aggregated once per player and season; teams
+are then rolled up and written in a process pool. With --snapshot the rows come
+from a local snapshot (see snapshot_store.py), so the export runs offline:
+    python export_reports.py --snapshot snapshots --season 2024/25 --format parquet
+    python export_reports.py --format xlsx   # reads Supabase (SUPABASE_URL / SUPABASE_ANON_KEY)
+"""
+import argparse
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from schema import apply_schema
+from stats_engine import (
+    BATTING_INPUT_COLUMNS, BOWLING_INPUT_COLUMNS, LEADER_KEYS, SUMMARY_BATTING_COLUMNS, SUMMARY_BOWLING_COLUMNS,
+    batting_player_season, bowling_player_season, dismissal_types, overall_batting, overall_bowling,
+    prepare_batting, prepare_bowling, reorder_columns, season_batting, season_bowling, unpack_dismissals
+)
+from supabase_fetch import fetch_rows, select_list
+
+FORMATS = ["parquet", "csv", "xlsx"]
+LINK_COLUMNS = "player_name,team,season,grade,player_url,player_id"
+BOWLING_HELPERS = ["balls_bowled", "Runs Conceded"]
+
+
+def slug(value) -> str:
+    """File-system safe name for a season, grade or team (e.g. 2024/25 -> 2024_25)."""
+    return re.sub(r"[^\w.-]+", "_", str(value)).strip("_") or "_"
+
+
+# ─────────────────────────────
+# Loading
+# ─────────────────────────────
+class Source:
+    """Reads tables from a local snapshot, or from Supabase when no snapshot is given."""
+
+    def __init__(self, snapshot_dir: str = None):
+        if snapshot_dir:
+            from snapshot_store import SnapshotStore
+            self.store, self.client = SnapshotStore(snapshot_dir), None
+        else:
+            from supabase_client import create_pooled_client
+            self.store = None
+            self.client = create_pooled_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_ANON_KEY"])
+
+    def rows(self, table: str, column: str = None, values: list = None, select: str = "*") -> pd.DataFrame:
+        if self.store is not None:
+            rows = self.store.read(table, column, values, select=select)
+        else:
+            rows = fetch_rows(self.client, table, column, values, select=select)
+        return apply_schema(rows, table)
+
+
+def player_season_aggs(source: Source, player_ids: list, summary_tables: bool = False):
+    """One bulk read per table, reduced to per-(player, season) batting and bowling aggregates.
+
+    player_ids=None reads the whole table (no in.() filter).
+    """
+    column = "player_id" if player_ids is not None else None
+    if summary_tables:
+        # Explicit columns: the summary tables' surrogate id must not reach the reports
+        batting = source.rows("player_season_batting", column, player_ids, select_list(SUMMARY_BATTING_COLUMNS))
+        bowling = source.rows("player_season_bowling", column, player_ids, select_list(SUMMARY_BOWLING_COLUMNS))
+        return (
+            unpack_dismissals(batting) if not batting.empty else batting,
+            reorder_columns(bowling, SUMMARY_BOWLING_COLUMNS),
+        )
+    batting = source.rows("player_data_batting", column, player_ids, select_list(BATTING_INPUT_COLUMNS))
+    bowling = source.rows("player_data_bowling", column, player_ids, select_list(BOWLING_INPUT_COLUMNS))
+    return (
+        batting_player_season(prepare_batting(batting), LEADER_KEYS) if not batting.empty else batting,
+        bowling_player_season(prepare_bowling(bowling), LEADER_KEYS) if not bowling.empty else bowling,
+    )
+
+
+def fill_names(agg: pd.DataFrame, links: pd.DataFrame) -> pd.DataFrame:
+    """Use the player_links name where an aggregate row has none."""
+    if agg.empty:
+        return agg
+    links = links.drop_duplicates("player_id")
+    names = links.set_index(links["player_id"].astype(str))["player_name"].astype(object)
+    fallback = agg["player_id"].astype(str).map(names)
+    return agg.assign(player_name=agg["player_name"].astype(object).fillna(fallback))
+
+
+# ─────────────────────────────
+# Per-team Reports (run in worker processes)
+# ─────────────────────────────
+def team_report(batting: pd.DataFrame, bowling: pd.DataFrame) -> dict:
+    """The app's four tables for one team's aggregates, with the same columns and order."""
+    tables = {}
+    if not batting.empty:
+        dismissals = dismissal_types(batting)
+        tables["overall_batting"] = (
+            overall_batting(batting, dismissals).drop(columns=["balls"]).sort_values("Average", ascending=False)
+        )
+        tables["season_batting"] = (
+            season_batting(batting, dismissals).drop(columns=["runs", "balls", "4s", "6s"])
+            .sort_values(["player_name", "season"])
+        )
+    if not bowling.empty:
+        tables["overall_bowling"] = (
+            overall_bowling(bowling).drop(columns=BOWLING_HELPERS).sort_values("Wickets", ascending=False)
+        )
+        tables["season_bowling"] = (
+            season_bowling(bowling).drop(columns=BOWLING_HELPERS).sort_values(["player_name", "season"])
+        )
+    return tables
+
+
+def write_tables(tables: dict, folder: str, fmt: str) -> list:
+    os.makedirs(folder, exist_ok=True)
+    if fmt == "xlsx":
+        path = os.path.join(folder, "report.xlsx")
+        with pd.ExcelWriter(path) as writer:
+            for name, df in tables.items():
+                df.to_excel(writer, sheet_name=name, index=False)
+        return [path]
+    paths = []
+    for name, df in tables.items():
+        path = os.path.join(folder, f"{name}.{fmt}")
+        if fmt == "parquet":
+            df.to_parquet(path, index=False)
+        else:
+            df.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+_worker = {}
+
+
+def _init_worker(batting: pd.DataFrame, bowling: pd.DataFrame, out: str, fmt: str):
+    """Receive the shared aggregates once per process instead of once per team."""
+    _worker.update(
+        batting=batting, bowling=bowling, out=out, fmt=fmt,
+        batting_ids=batting["player_id"].astype(str) if not batting.empty else None,
+        bowling_ids=bowling["player_id"].astype(str) if not bowling.empty else None,
+    )
+
+
+def _export_team(job: tuple) -> list:
+    (season, grade, team), player_ids = job
+    ids = set(player_ids)
+    batting, bowling = _worker["batting"], _worker["bowling"]
+    if _worker["batting_ids"] is not None:
+        batting = batting[_worker["batting_ids"].isin(ids)]
+    if _worker["bowling_ids"] is not None:
+        bowling = bowling[_worker["bowling_ids"].isin(ids)]
+    tables = team_report(batting, bowling)
+    if not tables:
+        return []
+    folder = os.path.join(_worker["out"], slug(season), slug(grade), slug(team))
+    return write_tables(tables, folder, _worker["fmt"])
+
+
+# ─────────────────────────────
+# Export
+# ─────────────────────────────
+def export(source: Source, out: str, fmt: str = "parquet", seasons: list = None, grades: list = None,
+           teams: list = None, exclude_teams: list = (), workers: int = None, summary_tables: bool = False) -> list:
+    """Write the report files for every matching team and return their paths."""
+    links = source.rows("player_links", select=LINK_COLUMNS).dropna(subset=["player_id"])
+    filtered = links
+    for column, wanted in (("season", seasons), ("grade", grades), ("team", teams)):
+        if wanted:
+            filtered = filtered[filtered[column].astype(str).isin(wanted)]
+    filtered = filtered[~filtered["team"].astype(str).isin(exclude_teams)]
+    if filtered.empty:
+        return []
+
+    # Teams' players' full history, as in the app - read everything unless the export is narrowed
+    narrowed = len(filtered) < len(links)
+    player_ids = filtered["player_id"].unique().tolist() if narrowed else None
+    batting, bowling = player_season_aggs(source, player_ids, summary_tables)
+    batting, bowling = fill_names(batting, links), fill_names(bowling, links)
+
+    jobs = [
+        (key, rows["player_id"].astype(str).unique().tolist())
+        for key, rows in filtered.groupby(["season", "grade", "team"], observed=True, sort=True)
+    ]
+    paths = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(batting, bowling, out, fmt)) as pool:
+        for written in pool.map(_export_team, jobs, chunksize=max(1, len(jobs) // 64)):
+            paths.extend(written)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write every team's batting and bowling report tables to files.")
+    parser.add_argument("--out", default="reports")
+    parser.add_argument("--format", choices=FORMATS, default="parquet")
+    parser.add_argument("--snapshot", default=os.getenv("SNAPSHOT_DIR"),
+                        help="read from this local snapshot instead of Supabase")
+    parser.add_argument("--season", nargs="*", help="only these seasons (default: all)")
+    parser.add_argument("--grade", nargs="*", help="only these grades (default: all)")
+    parser.add_argument("--team", nargs="*", help="only these teams (default: all)")
+    parser.add_argument("--exclude-team", nargs="*", default=["BAY"])
+    parser.add_argument("--summary-tables", action="store_true",
+                        help="read player_season_batting / player_season_bowling instead of the raw tables")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+    if args.format == "xlsx":
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            parser.error("--format xlsx needs openpyxl (pip install openpyxl)")
+
+    start = time.perf_counter()
+    paths = export(Source(args.snapshot), args.out, args.format, args.season, args.grade, args.team,
+                   args.exclude_team, args.workers, args.summary_tables)
+    print(f"Wrote {len(paths)} files to {args.out} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
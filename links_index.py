@@ -0,0 +1,27 @@
+import pandas as pd
+
+TEAM_KEYS = ["season", "grade", "team"]
+PLAYER_COLUMNS = ["player_name", "player_url", "player_id"]
+EMPTY_PLAYERS = pd.DataFrame(columns=PLAYER_COLUMNS)
+
+
+def build_links_index(links: pd.DataFrame) -> dict:
+    """Nest player_links as season -> grade -> team -> player rows (name, url, id).
+
+    Built once per player_links refresh so the selection widgets and the team lookup
+    are dictionary hits instead of boolean masks over the whole table.
+    Names, teams and grades are stored as categoricals.
+    """
+    # One de-duplication and one groupby pass; each team's frame is then a single take
+    links = links.drop_duplicates(TEAM_KEYS + PLAYER_COLUMNS, ignore_index=True)
+    links = links.astype({"player_name": "category", "team": "category", "grade": "category"})
+    players = links[PLAYER_COLUMNS]
+    index = {}
+    for (season, grade, team), positions in links.groupby(TEAM_KEYS, observed=True, sort=True).indices.items():
+        index.setdefault(season, {}).setdefault(grade, {})[team] = players.take(positions)
+    return index
+
+
+def team_players(index: dict, season, grade, team) -> pd.DataFrame:
+    """Player rows for one team, or an empty frame if the combination doesn't exist."""
+    return index.get(season, {}).get(grade, {}).get(team, EMPTY_PLAYERS)
@@ -0,0 +1,79 @@
+"""Cricket overs held as whole balls.
+
+Scorecards write overs as <overs>.<balls> - 3.5 is 3 overs and 5 balls (23 balls), not
+3.5 overs - so the notation can't be summed or divided as a decimal. Overs are parsed
+once into int64 ball counts; sums, economy and strike rate are exact integer
+arithmetic, and the notation only comes back for display.
+"""
+import numpy as np
+import pandas as pd
+
+BALLS_PER_OVER = 6
+
+
+def parse_overs(values, errors: str = "raise") -> pd.Series:
+    """Total balls for cricket-notation overs (floats, ints or strings such as "3.5").
+
+    The part after the point must be a single digit from 0 to 5. Missing values count
+    as 0 balls. Anything else malformed (3.7, 3.55, -1, "abc") raises ValueError, or
+    becomes <NA> with errors="coerce" (the result is then nullable Int64).
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce', not {errors!r}")
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+
+    if pd.api.types.is_integer_dtype(series) and not series.hasnans:
+        number = series.to_numpy(dtype="int64")
+        invalid = number < 0
+        balls = number * BALLS_PER_OVER
+    else:
+        if pd.api.types.is_float_dtype(series):
+            number = series.to_numpy(dtype="float64", na_value=np.nan)
+        else:
+            number = pd.to_numeric(series, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        # In-place steps on three float buffers - this runs over every bowling row
+        with np.errstate(invalid="ignore"):
+            scratch = number * 10
+            tenths = np.rint(scratch)
+            np.subtract(scratch, tenths, out=scratch)
+            invalid = np.abs(scratch, out=scratch) > 1e-6          # more than one decimal place
+            whole = np.multiply(tenths, 0.1)
+            np.floor(whole, out=whole)
+            part = np.subtract(tenths, np.multiply(whole, 10, out=scratch), out=tenths)
+            invalid |= part >= BALLS_PER_OVER
+            invalid |= whole < 0
+            balls = np.add(np.multiply(whole, BALLS_PER_OVER, out=whole), part, out=whole)
+        not_finite = ~np.isfinite(number)
+        if not_finite.any():
+            # NaN from a missing value is 0 balls; NaN from unparseable text and inf are invalid
+            invalid |= np.isinf(number) | (np.isnan(number) & series.notna().to_numpy())
+            balls[not_finite] = 0
+        balls = balls.astype("int64")
+
+    if not invalid.any():
+        return pd.Series(balls, index=series.index, name=series.name)
+    if errors == "raise":
+        bad = series[invalid]
+        raise ValueError(f"{len(bad)} invalid overs value(s), e.g. {bad.head(5).tolist()}")
+    return pd.Series(balls, index=series.index, name=series.name, dtype="Int64").mask(invalid)
+
+
+def invalid_overs(values) -> pd.Series:
+    """Boolean mask of the values parse_overs would reject."""
+    return parse_overs(values, errors="coerce").isna()
+
+
+def overs_notation(balls):
+    """Ball counts back to cricket notation (23 -> 3.5), for display only."""
+    whole, part = np.divmod(balls, BALLS_PER_OVER)
+    return whole + part / 10
+
+
+def economy(runs, balls):
+    """Runs per over (6 balls). Zero balls gives inf / NaN, as dividing by zero overs did."""
+    return runs * BALLS_PER_OVER / balls
+
+
+def strike_rate(balls, wickets):
+    """Balls per wicket."""
+    return balls / wickets
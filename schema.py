@@ -0,0 +1,54 @@
+"""Declared column types for the Supabase tables, applied once when rows are loaded.
+
+Names, teams, seasons and dismissal types become categoricals and per-innings counts
+become small integers, instead of the object columns pd.DataFrame(res.data) produces.
+"""
+import pandas as pd
+
+CATEGORY = "category"
+
+SCHEMAS = {
+    "player_links": {
+        "player_name": CATEGORY, "team": CATEGORY, "season": CATEGORY, "grade": CATEGORY,
+    },
+    "player_data_batting": {
+        "player_name": CATEGORY, "season": CATEGORY, "how_out": CATEGORY,
+        "runs": "int16", "balls": "int16", "4s": "int8", "6s": "int8", "innings": "int8",
+    },
+    "player_data_bowling": {
+        "player_name": CATEGORY, "season": CATEGORY,
+        "innings": "int8", "overs": "float64", "wickets": "int8", "runs_conceded": "int16", "maidens": "int8",
+        "top_4_w": "int8", "bottom_4_w": "int8", "bowled": "int8", "caught": "int8", "lbw": "int8",
+        "c_and_b": "int8", "stumped": "int8", "other_wicket": "int8",
+    },
+    "wickets": {
+        "team_bat": CATEGORY, "team_bowl": CATEGORY, "how_out": CATEGORY, "how_out_norm": CATEGORY,
+    },
+    # Summary tables hold season totals, so counts need more headroom
+    "player_season_batting": {
+        "player_name": CATEGORY, "season": CATEGORY,
+        "runs": "int32", "balls": "int32", "4s": "int32", "6s": "int32", "innings": "int32", "rows": "int32",
+    },
+    "player_season_bowling": {
+        "player_name": CATEGORY, "season": CATEGORY,
+        "innings": "int32", "balls_bowled": "int32", "runs_conceded": "int32", "wickets": "int32",
+        "top_4_w": "int32", "bottom_4_w": "int32", "bowled": "int32", "caught": "int32", "lbw": "int32",
+        "c_and_b": "int32", "stumped": "int32", "other_wicket": "int32",
+    },
+}
+
+
+def apply_schema(df: pd.DataFrame, table: str) -> pd.DataFrame:
+    """Return `df` with the declared types for `table`. Unparseable numbers become 0."""
+    schema = SCHEMAS.get(table)
+    if not schema or df.empty:
+        return df
+    converted = {}
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            continue
+        if dtype == CATEGORY:
+            converted[col] = df[col].astype(CATEGORY)
+        else:
+            converted[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(dtype)
+    return df.assign(**converted)
@@ -0,0 +1,159 @@
+"""Local Parquet snapshot of the stats tables with incremental sync.
+
+Layout: <root>/<table>/season=<season>/part-<last id>.parquet plus <root>/_state.json,
+which holds each table's high-water mark (largest synced id) and last sync time.
+Each part file holds a single season, so season filters prune whole files.
+
+Sync from the command line (uses SUPABASE_URL / SUPABASE_ANON_KEY):
+    python snapshot_store.py --dir snapshots
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from urllib.parse import quote
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+    import pyarrow.parquet as pq
+except ImportError:  # optional - the app falls back to Supabase without it
+    pa = None
+
+from supabase_fetch import PAGE_SIZE, fetch_chunk
+
+TABLES = ["player_links", "player_data_batting", "player_data_bowling", "wickets"]
+STATE_FILE = "_state.json"
+NO_SEASON = "__none__"
+
+
+def parse_select(select: str):
+    """Turn a PostgREST select string into a column list (None for '*')."""
+    if select.strip() == "*":
+        return None
+    return [c.strip().strip('"') for c in select.split(",")]
+
+
+class SnapshotStore:
+    """Season-partitioned Parquet copy of the Supabase tables."""
+
+    def __init__(self, root: str, key: str = "id"):
+        if pa is None:
+            raise ImportError("pyarrow is required for the local snapshot store")
+        self.root = root
+        self.key = key
+        self._fs = pafs.LocalFileSystem(use_mmap=True)
+        self._lock = threading.Lock()
+
+    # ─────────── State ───────────
+    def _state_path(self) -> str:
+        return os.path.join(self.root, STATE_FILE)
+
+    def state(self) -> dict:
+        try:
+            with open(self._state_path()) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _save_state(self, state: dict):
+        os.makedirs(self.root, exist_ok=True)
+        tmp = self._state_path() + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp, self._state_path())
+
+    def is_fresh(self, table: str, max_age: float) -> bool:
+        """True if `table` was synced within the last `max_age` seconds."""
+        synced_at = self.state().get(table, {}).get("synced_at")
+        return synced_at is not None and time.time() - synced_at <= max_age
+
+    # ─────────── Sync ───────────
+    def sync_table(self, client, table: str, page_size: int = PAGE_SIZE) -> int:
+        """Pull rows past the table's high-water mark and append them. Returns rows added."""
+        with self._lock:
+            state = self.state()
+            table_state = state.get(table, {})
+            df = fetch_chunk(client, table, page_size=page_size, key=self.key,
+                             after=table_state.get("high_water"))
+            if not df.empty:
+                high_water = df[self.key].max()
+                self._write(table, df, high_water)
+                table_state["high_water"] = high_water.item() if hasattr(high_water, "item") else high_water
+                table_state["rows"] = table_state.get("rows", 0) + len(df)
+            table_state["synced_at"] = time.time()
+            state[table] = table_state
+            self._save_state(state)
+            return len(df)
+
+    def sync(self, client, tables: list = None) -> dict:
+        return {table: self.sync_table(client, table) for table in (tables or TABLES)}
+
+    def _write(self, table: str, df: pd.DataFrame, high_water):
+        groups = df.groupby("season", dropna=False) if "season" in df.columns else [(NO_SEASON, df)]
+        for season, part in groups:
+            season = NO_SEASON if pd.isna(season) else season
+            folder = os.path.join(self.root, table, f"season={quote(str(season), safe='')}")
+            os.makedirs(folder, exist_ok=True)
+            pq.write_table(
+                pa.Table.from_pandas(part, preserve_index=False),
+                os.path.join(folder, f"part-{high_water}.parquet")
+            )
+
+    # ─────────── Read ───────────
+    def _files(self, table: str) -> list:
+        base = os.path.join(self.root, table)
+        return sorted(
+            os.path.join(folder, name)
+            for folder, _, names in os.walk(base)
+            for name in names if name.endswith(".parquet")
+        )
+
+    def read(self, table: str, column: str = None, values: list = None, select: str = "*",
+             filters: dict = None) -> pd.DataFrame:
+        """Read `table` with the same filter/projection arguments as fetch_rows.
+
+        Files are memory-mapped and only the projected columns are decoded.
+        """
+        files = self._files(table)
+        if not files:
+            return pd.DataFrame()
+        schema = pa.unify_schemas(
+            [pq.read_schema(f, memory_map=True) for f in files], promote_options="permissive"
+        )
+        dataset = ds.dataset(files, schema=schema, format="parquet", filesystem=self._fs)
+
+        expr = None
+        if column is not None:
+            values = [v for v in values if v is not None]
+            if not values:
+                return pd.DataFrame()
+            expr = ds.field(column).isin(values)
+        for col, allowed in (filters or {}).items():
+            col_expr = ds.field(col).isin(list(allowed))
+            expr = col_expr if expr is None else expr & col_expr
+
+        columns = parse_select(select)
+        if columns is not None:
+            columns = [c for c in columns if c in schema.names]
+        return dataset.to_table(columns=columns, filter=expr).to_pandas()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally sync the local stats snapshot from Supabase.")
+    parser.add_argument("--dir", default=os.getenv("SNAPSHOT_DIR", "snapshots"))
+    parser.add_argument("--tables", nargs="*", default=TABLES)
+    args = parser.parse_args()
+
+    from supabase_client import create_pooled_client
+    client = create_pooled_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_ANON_KEY"])
+    for table, added in SnapshotStore(args.dir).sync(client, args.tables).items():
+        print(f"{table}: {added} new rows")
+
+
+if __name__ == "__main__":
+    main()
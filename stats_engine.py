@@ -0,0 +1,247 @@
+"""Batting and bowling aggregation, free of any Streamlit code.
+
+Raw innings rows (as stored in player_data_batting / player_data_bowling) are
+reduced once to an additive per-(player, season) table. The displayed tables are
+rollups of that table, with ratios recomputed from the summed components, so
+season and player filters only ever touch players x seasons rows.
+All work is done with groupby / unstack - no per-row Python.
+"""
+import json
+
+import numpy as np
+import pandas as pd
+
+from overs import economy, overs_notation, parse_overs, strike_rate
+
+BATTING_SUMS = ["4s", "6s", "runs", "balls", "innings"]
+# Non-dismissal columns a batting aggregate can carry
+BATTING_AGG_COLUMNS = {"player_id", "player_name", "season", "rows", *BATTING_SUMS}
+BOWLING_NUMERIC = ["innings", "overs", "wickets", "runs_conceded", "maidens", "top_4_w", "bottom_4_w",
+                   "bowled", "caught", "lbw", "c_and_b", "stumped", "other_wicket"]
+# Columns of the raw tables the aggregation reads - used for projection push-down
+BATTING_INPUT_COLUMNS = ["player_id", "player_name", "season", "how_out"] + BATTING_SUMS
+BOWLING_INPUT_COLUMNS = ["player_id", "player_name", "season"] + BOWLING_NUMERIC
+BOWLING_SUMS = ["innings", "balls_bowled", "runs_conceded", "wickets", "top_4_w", "bottom_4_w", "bowled",
+                "caught", "lbw", "c_and_b", "stumped", "other_wicket"]
+# include maidens by adding "maidens" to BOWLING_SUMS and to the column orders below
+# Season label for rows stored without one - they are counted, filtered and shown like any season
+MISSING_SEASON = "(no season)"
+# Columns of the player_season_* summary tables (build_summaries.py) - their surrogate id is left out
+SUMMARY_KEYS = ["player_id", "player_name", "season"]
+SUMMARY_BATTING_COLUMNS = SUMMARY_KEYS + BATTING_SUMS + ["rows", "dismissals"]
+SUMMARY_BOWLING_COLUMNS = SUMMARY_KEYS + BOWLING_SUMS
+
+BOWLING_RENAME = {
+    "top_4_w": "Top 4 Wickets", "bottom_4_w": "Tail Wickets",
+    "c_and_b": "C&B", "other_wicket": "Other", "runs_conceded": "Runs Conceded", "stumped": "Stumped",
+    "innings": "Innings", "wickets": "Wickets", "lbw": "LBW", "bowled": "Bowled", "caught": "Caught",
+}
+OVERALL_BOWLING_COLUMNS = [
+    "player_name", "Innings", "Overs", "Wickets", "Avg", "Runs Conceded", "Economy",
+    "SR", "Top 4 Wickets", "Tail Wickets", "Bowled", "Caught", "LBW", "C&B", "Stumped", "Other",
+    "balls_bowled"
+]
+SEASON_BOWLING_COLUMNS = OVERALL_BOWLING_COLUMNS[:1] + ["season"] + OVERALL_BOWLING_COLUMNS[1:]
+
+
+def reorder_columns(df: pd.DataFrame, desired_order: list) -> pd.DataFrame:
+    actual = [col for col in desired_order if col in df.columns]
+    return df[actual]
+
+
+# ─────────────────────────────
+# Preparation
+# ─────────────────────────────
+def to_numeric(df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """Return `df` with `columns` coerced to numbers (bad values become 0).
+
+    Compact integer columns are widened to int64 so group sums can't overflow.
+    """
+    def widen(col):
+        values = pd.to_numeric(df[col], errors="coerce").fillna(0)
+        return values.astype("int64") if pd.api.types.is_integer_dtype(values) else values
+    return df.assign(**{col: widen(col) for col in columns})
+
+
+def fill_season(df: pd.DataFrame) -> pd.DataFrame:
+    """Label rows without a season MISSING_SEASON (categorical seasons get the extra category)."""
+    if "season" not in df.columns or not df["season"].isna().any():
+        return df
+    season = df["season"]
+    if isinstance(season.dtype, pd.CategoricalDtype) and MISSING_SEASON not in season.cat.categories:
+        season = season.cat.add_categories([MISSING_SEASON])
+    return df.assign(season=season.fillna(MISSING_SEASON))
+
+
+def prepare_batting(df: pd.DataFrame) -> pd.DataFrame:
+    return to_numeric(fill_season(df), BATTING_SUMS)
+
+
+def prepare_bowling(df: pd.DataFrame, errors: str = "coerce") -> pd.DataFrame:
+    """Coerce bowling numbers and add the balls_bowled column (exact balls from the overs notation).
+
+    With errors="coerce" rows with malformed overs (e.g. 3.7) are left out whole, runs and
+    wickets included - count them beforehand with overs.invalid_overs to report them.
+    errors="raise" rejects them.
+    """
+    balls = parse_overs(df["overs"], errors=errors)
+    if balls.dtype != "int64":
+        valid = balls.notna().to_numpy()
+        df, balls = df[valid], balls[valid].astype("int64")
+    return to_numeric(fill_season(df), BOWLING_NUMERIC).assign(balls_bowled=balls)
+
+
+# ─────────────────────────────
+# Per-(player, season) Aggregates
+# ─────────────────────────────
+def batting_player_season(df: pd.DataFrame, keys: list = None) -> pd.DataFrame:
+    """Additive batting totals per player and season, one count column per how_out type.
+
+    `rows` is the number of innings rows, kept so Average can be rebuilt after summing.
+    Expects rows from prepare_batting, where a missing season is already MISSING_SEASON.
+    """
+    by = (keys or ["player_name"]) + ["season"]
+    grouped = df.groupby(by, observed=True)
+    totals = grouped[BATTING_SUMS].sum()
+    totals["rows"] = grouped.size()
+
+    how_out = df.dropna(subset=["how_out"])
+    if not how_out.empty:
+        counts = how_out.groupby(by + ["how_out"], observed=True).size().unstack(fill_value=0)
+        counts = counts.reindex(index=totals.index, columns=sorted(counts.columns), fill_value=0)
+        totals = totals.join(counts.fillna(0).astype(int))
+    return totals.reset_index()
+
+
+def bowling_player_season(df: pd.DataFrame, keys: list = None) -> pd.DataFrame:
+    """Additive bowling totals per player and season. Expects rows from prepare_bowling."""
+    by = (keys or ["player_name"]) + ["season"]
+    return df.groupby(by, observed=True)[BOWLING_SUMS].sum().reset_index()
+
+
+def pack_dismissals(agg: pd.DataFrame) -> pd.DataFrame:
+    """Fold a batting aggregate's how_out count columns into one JSON `dismissals` column.
+
+    This is the fixed-schema shape stored in the player_season_batting summary table.
+    """
+    cols = [c for c in agg.columns if c not in BATTING_AGG_COLUMNS]
+    counts = agg[cols].to_dict("records")
+    packed = [json.dumps({k: int(v) for k, v in row.items() if v}) for row in counts]
+    return agg.drop(columns=cols).assign(dismissals=packed)
+
+
+def unpack_dismissals(summary: pd.DataFrame) -> pd.DataFrame:
+    """Inverse of pack_dismissals: expand `dismissals` back into how_out count columns.
+
+    Only the key and sum columns are kept next to the counts, so extra columns of the
+    stored table (e.g. its id) can't be mistaken for dismissal types.
+    """
+    parsed = [json.loads(v) if isinstance(v, str) else (v or {}) for v in summary["dismissals"]]
+    counts = pd.DataFrame(parsed, index=summary.index)
+    counts = counts.reindex(columns=sorted(counts.columns)).fillna(0).astype(int)
+    return pd.concat([reorder_columns(summary, SUMMARY_BATTING_COLUMNS[:-1]), counts], axis=1)
+
+
+# ─────────────────────────────
+# Batting
+# ─────────────────────────────
+def dismissal_types(agg: pd.DataFrame) -> list:
+    """how_out columns of a batting aggregate that have at least one dismissal."""
+    cols = [c for c in agg.columns if c not in BATTING_AGG_COLUMNS]
+    return [c for c in cols if agg[c].sum() > 0]
+
+
+def _batting_rollup(agg: pd.DataFrame, by: list, dismissals: list) -> pd.DataFrame:
+    totals = agg.groupby(by, observed=True)[BATTING_SUMS + ["rows"] + list(dismissals)].sum()
+    totals["SR"] = ((totals["runs"] / totals["balls"]) * 100).round(2).replace([np.inf, -np.inf], 0)
+    totals["Average"] = (totals["runs"] / totals["rows"]).round(2)
+    totals["% Boundary Runs"] = (((totals["4s"] * 4) + (totals["6s"] * 6)) / totals["runs"] * 100).round(2)
+    return totals.drop(columns="rows")
+
+
+def overall_batting(agg: pd.DataFrame, dismissals: list = None) -> pd.DataFrame:
+    """Table 1: one row per player, rolled up from batting_player_season."""
+    dismissals = dismissal_types(agg) if dismissals is None else dismissals
+    out = _batting_rollup(agg, ["player_name"], dismissals)
+    out["Avg. boundary per inns."] = ((out["4s"] + out["6s"]) / out["innings"]).round(2)
+    out = out.rename(columns={"innings": "Innings"}).reset_index()
+    return reorder_columns(out, ["player_name", "4s", "6s", "runs", "balls", "Innings"] + list(dismissals)
+                           + ["SR", "Average", "% Boundary Runs", "Avg. boundary per inns."])
+
+
+def season_batting(agg: pd.DataFrame, dismissals: list = None) -> pd.DataFrame:
+    """Table 2: one row per player and season, from batting_player_season."""
+    dismissals = dismissal_types(agg) if dismissals is None else dismissals
+    out = _batting_rollup(agg, ["player_name", "season"], dismissals)
+    out["Avg. 4s per inns."] = (out["4s"] / out["innings"]).round(2)
+    out["Avg. 6s per inns."] = (out["6s"] / out["innings"]).round(2)
+    out = out.reset_index()
+    return reorder_columns(out, ["player_name", "season", "4s", "6s", "runs", "balls", "innings"] + list(dismissals)
+                           + ["SR", "Average", "% Boundary Runs", "Avg. 4s per inns.", "Avg. 6s per inns."])
+
+
+# ─────────────────────────────
+# Bowling
+# ─────────────────────────────
+def _bowling_rollup(agg: pd.DataFrame, by: list) -> pd.DataFrame:
+    totals = agg.groupby(by, observed=True)[BOWLING_SUMS].sum().reset_index()
+    totals["Economy"] = economy(totals["runs_conceded"], totals["balls_bowled"]).round(2)
+    totals["SR"] = strike_rate(totals["balls_bowled"], totals["wickets"]).round(2)
+    totals["Overs"] = overs_notation(totals["balls_bowled"])
+    totals["Avg"] = (totals["runs_conceded"] / totals["wickets"]).round(2)
+    return totals.rename(columns=BOWLING_RENAME)
+
+
+def overall_bowling(agg: pd.DataFrame) -> pd.DataFrame:
+    """Table 3: one row per bowler, rolled up from bowling_player_season."""
+    return reorder_columns(_bowling_rollup(agg, ["player_name"]), OVERALL_BOWLING_COLUMNS)
+
+
+def season_bowling(agg: pd.DataFrame) -> pd.DataFrame:
+    """Table 4: one row per bowler and season, from bowling_player_season."""
+    return reorder_columns(_bowling_rollup(agg, ["player_name", "season"]), SEASON_BOWLING_COLUMNS)
+
+
+# ─────────────────────────────
+# Grade Leaderboards
+# ─────────────────────────────
+LEADER_KEYS = ["player_id", "player_name"]
+
+
+def add_rankings(df: pd.DataFrame, columns: dict) -> pd.DataFrame:
+    """Add '<col> Rank' (1 = best) and '<col> Pctl' (100 = best) for each of `columns`.
+
+    `columns` maps a column to True when higher is better. Ties share the best rank;
+    undefined ratios (no balls, no wickets) are left unranked.
+    """
+    ranked = {}
+    for col, higher_is_better in columns.items():
+        values = df[col].replace([np.inf, -np.inf], np.nan)
+        ranked[f"{col} Rank"] = values.rank(method="min", ascending=not higher_is_better).astype("Int64")
+        ranked[f"{col} Pctl"] = (values.rank(pct=True, ascending=higher_is_better) * 100).round(1)
+    return df.assign(**ranked)
+
+
+def batting_leaderboard(agg: pd.DataFrame, min_innings: int = 1) -> pd.DataFrame:
+    """One row per batter with Average and SR ranks against everyone with `min_innings`.
+
+    Expects a batting_player_season table built with keys=LEADER_KEYS, so players who
+    share a name stay separate.
+    """
+    out = _batting_rollup(agg, LEADER_KEYS, []).reset_index()
+    out = out[out["innings"] >= min_innings].rename(columns={"innings": "Innings"})
+    out = add_rankings(out, {"Average": True, "SR": True})
+    return reorder_columns(out, LEADER_KEYS + ["Innings", "runs", "balls", "Average", "Average Rank", "Average Pctl",
+                                               "SR", "SR Rank", "SR Pctl", "% Boundary Runs"])
+
+
+def bowling_leaderboard(agg: pd.DataFrame, min_innings: int = 1) -> pd.DataFrame:
+    """One row per bowler with Economy and strike-rate ranks (lower is better).
+
+    Expects a bowling_player_season table built with keys=LEADER_KEYS.
+    """
+    out = _bowling_rollup(agg, LEADER_KEYS)
+    out = out[out["Innings"] >= min_innings]
+    out = add_rankings(out, {"Economy": False, "SR": False})
+    return reorder_columns(out, LEADER_KEYS + ["Innings", "Overs", "Wickets", "Avg", "Economy", "Economy Rank",
+                                               "Economy Pctl", "SR", "SR Rank", "SR Pctl"])
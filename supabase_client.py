@@ -0,0 +1,52 @@
+import os
+
+import httpx
+from supabase import Client, ClientOptions, create_client
+
+import timing
+
+# ─────────────────────────────
+# Connection Settings
+# ─────────────────────────────
+POOL_SIZE = int(os.getenv("SUPABASE_POOL_SIZE", 20))
+TIMEOUT = float(os.getenv("SUPABASE_TIMEOUT", 30))
+CONNECT_TIMEOUT = float(os.getenv("SUPABASE_CONNECT_TIMEOUT", 5))
+KEEPALIVE_EXPIRY = float(os.getenv("SUPABASE_KEEPALIVE_EXPIRY", 60))
+# Transport-level retries for failed connection attempts (request retries live in supabase_fetch)
+CONNECT_RETRIES = int(os.getenv("SUPABASE_CONNECT_RETRIES", 2))
+
+
+def _record_payload(response: httpx.Response):
+    """Add the response's wire size to the open timing span (e.g. a supabase_fetch query)."""
+    if timing.active():
+        response.read()
+        timing.add(payload_bytes=response.num_bytes_downloaded)
+
+
+def create_http_client(pool_size: int = POOL_SIZE, timeout: float = TIMEOUT,
+                       connect_timeout: float = CONNECT_TIMEOUT) -> httpx.Client:
+    """Keep-alive HTTP client shared by every query. httpx.Client is thread-safe."""
+    limits = httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=pool_size,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+    return httpx.Client(
+        timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        # Limits go on the transport - httpx ignores Client(limits=...) when a transport is given
+        transport=httpx.HTTPTransport(limits=limits, retries=CONNECT_RETRIES),
+        follow_redirects=True,
+        event_hooks={"response": [_record_payload]},
+    )
+
+
+def create_pooled_client(url: str, key: str, pool_size: int = POOL_SIZE, timeout: float = TIMEOUT,
+                         connect_timeout: float = CONNECT_TIMEOUT) -> Client:
+    """Supabase client whose PostgREST queries share one pooled HTTP client."""
+    http = create_http_client(pool_size, timeout, connect_timeout)
+    try:
+        options = ClientOptions(httpx_client=http)
+    except TypeError:  # supabase-py without httpx_client support - fall back to its own pool
+        http.close()
+        options = ClientOptions(postgrest_client_timeout=timeout)
+    return create_client(url, key, options=options)
@@ -0,0 +1,184 @@
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pandas as pd
+
+import timing
+
+# ─────────────────────────────
+# Fetch Settings
+# ─────────────────────────────
+# CHUNK_SIZE keeps the in.(...) filter (and so the request URL) short.
+# PAGE_SIZE must not exceed the PostgREST max-rows setting (Supabase default 1000),
+# otherwise a capped page looks like the last page.
+CHUNK_SIZE = int(os.getenv("FETCH_CHUNK_SIZE", 100))
+PAGE_SIZE = int(os.getenv("FETCH_PAGE_SIZE", 1000))
+MAX_WORKERS = int(os.getenv("FETCH_MAX_WORKERS", 8))
+RETRIES = int(os.getenv("FETCH_RETRIES", 3))
+RETRY_BACKOFF = float(os.getenv("FETCH_RETRY_BACKOFF", 0.5))
+# Network-level failures worth another attempt (timeouts, dropped connections)
+RETRY_ON = (httpx.TransportError,)
+# Characters PostgREST reserves inside in.() lists and or=() logic trees
+RESERVED = set(',.:()" ')
+
+
+def execute_with_retry(query, retries: int = RETRIES, backoff: float = RETRY_BACKOFF):
+    """Run `query.execute()`, retrying transient failures with exponential backoff and jitter."""
+    for attempt in range(retries + 1):
+        try:
+            return query.execute()
+        except RETRY_ON:
+            if attempt == retries:
+                raise
+            time.sleep(backoff * (2 ** attempt) * (0.5 + random.random()))
+
+
+def run_query(query, table: str):
+    """execute_with_retry inside a timing span that records the page's row count."""
+    with timing.span("query", table=table) as span:
+        res = execute_with_retry(query)
+        data = res.data
+        span["rows"] = len(data) if data is not None else 0
+    return res
+
+
+def chunked(values: list, size: int) -> list:
+    """Split a list into consecutive chunks of at most `size` items."""
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
+
+def select_list(columns: list) -> str:
+    """Build a PostgREST select string, quoting names PostgREST can't parse bare (e.g. 4s)."""
+    return ",".join(f'"{c}"' if c[:1].isdigit() else c for c in columns)
+
+
+def filter_value(value) -> str:
+    """Format one value of an in.() list or or=() logic tree, quoting it when it has reserved characters.
+
+    A plain eq./gt./lt. value doesn't need this - PostgREST takes it verbatim, quotes included.
+    """
+    text = str(value)
+    if any(ch in RESERVED for ch in text):
+        return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return text
+
+
+def keyset_before(order_by: str, key: str, cursor: tuple) -> str:
+    """or=() filter for the rows after `cursor` = (order_by value, key value) in descending order.
+
+    Rows that tie on `order_by` are split by `key`, so none are skipped between pages.
+    """
+    at, last = filter_value(cursor[0]), filter_value(cursor[1])
+    return f"{order_by}.lt.{at},and({order_by}.eq.{at},{key}.lt.{last})"
+
+
+def _with_key(select: str, key: str) -> str:
+    """Make sure the keyset column is part of the projection."""
+    if select.strip() == "*":
+        return select
+    cols = [c.strip().strip('"') for c in select.split(",")]
+    return select if key in cols else f"{select},{key}"
+
+
+def to_frame(pages: list) -> pd.DataFrame:
+    """Combine result pages into one frame.
+
+    A page is either the JSON payload (list of dicts) from the Supabase client or a
+    DataFrame already parsed by wire_format.RestClient.
+    """
+    frames = [page for page in pages if isinstance(page, pd.DataFrame) and not page.empty]
+    rows = [row for page in pages if isinstance(page, list) for row in page]
+    if rows:
+        frames.append(pd.DataFrame(rows))
+    if not frames:
+        return pd.DataFrame()
+    return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+
+def _last(page, key):
+    return page[key].iloc[-1] if isinstance(page, pd.DataFrame) else page[-1][key]
+
+
+def fetch_chunk(client, table: str, select: str = "*", column: str = None, values: list = None,
+                page_size: int = PAGE_SIZE, key: str = "id", after=None, filters: dict = None) -> pd.DataFrame:
+    """Fetch every row of one chunk, paging with keyset pagination on `key`.
+
+    Only rows with `key` greater than `after` are returned when it is given.
+    `filters` maps extra columns to allowed values and is pushed into the query.
+    """
+    select = _with_key(select, key)
+    pages = []
+    last = after
+    while True:
+        query = client.table(table).select(select)
+        if column is not None:
+            query = query.in_(column, values)
+        for col, allowed in (filters or {}).items():
+            query = query.in_(col, list(allowed))
+        if last is not None:
+            query = query.gt(key, last)
+        res = run_query(query.order(key).limit(page_size), table)
+        page = res.data if res.data is not None else []
+        pages.append(page)
+        if len(page) < page_size:
+            return to_frame(pages)
+        last = _last(page, key)
+
+
+def fetch_rows(client, table: str, column: str = None, values: list = None, select: str = "*",
+               chunk_size: int = CHUNK_SIZE, page_size: int = PAGE_SIZE,
+               max_workers: int = MAX_WORKERS, key: str = "id", filters: dict = None) -> pd.DataFrame:
+    """Fetch all rows of `table` where `column` is in `values` as one DataFrame.
+
+    The id list is split into chunks of `chunk_size`, each chunk is paged through
+    on a thread pool, and the results are stitched into a single frame.
+    With `column=None` the whole table is paged through instead.
+    """
+    if column is None:
+        return fetch_chunk(client, table, select, page_size=page_size, key=key, filters=filters)
+
+    values = list(dict.fromkeys(v for v in values if v is not None))
+    if not values:
+        return pd.DataFrame()
+
+    chunks = chunked(values, chunk_size)
+    if len(chunks) == 1:
+        results = [fetch_chunk(client, table, select, column, chunks[0], page_size, key, filters=filters)]
+    else:
+        fetch = timing.in_run(
+            lambda ids: fetch_chunk(client, table, select, column, ids, page_size, key, filters=filters)
+        )
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+            results = list(pool.map(fetch, chunks))
+
+    return to_frame(results)
+
+
+def fetch_latest(client, table: str, column: str, values: list, order_by: str, limit: int,
+                 select: str = "*", before: dict = None, key: str = "id",
+                 max_workers: int = MAX_WORKERS) -> pd.DataFrame:
+    """Newest `limit` rows per value of `column`, newest first by `order_by`, then by `key`.
+
+    `before` maps a value to the (`order_by`, `key`) cursor of the last row already seen;
+    only rows after it are returned (keyset pagination). One small query per value, run
+    on a thread pool.
+    """
+    values = list(dict.fromkeys(v for v in values if v is not None))
+    if not values:
+        return pd.DataFrame()
+    before = before or {}
+    select = _with_key(select, key)
+
+    def latest(value):
+        query = client.table(table).select(select).eq(column, value)
+        if value in before:
+            query = query.or_(keyset_before(order_by, key, before[value]))
+        data = run_query(query.order(order_by, desc=True).order(key, desc=True).limit(limit), table).data
+        return data if data is not None else []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(values))) as pool:
+        results = list(pool.map(timing.in_run(latest), values))
+    return to_frame(results)
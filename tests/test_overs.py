@@ -0,0 +1,164 @@
+import os
+import sys
+from fractions import Fraction
+
+import numpy as np
+import pandas as pd
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from overs import BALLS_PER_OVER, economy, invalid_overs, overs_notation, parse_overs, strike_rate  # noqa: E402
+
+
+wholes = st.integers(min_value=0, max_value=10 ** 6)
+parts = st.integers(min_value=0, max_value=BALLS_PER_OVER - 1)
+
+
+# ─────────────────────────────
+# Properties
+# ─────────────────────────────
+@given(wholes, parts)
+def test_string_and_float_notation_parse_to_balls(whole, part):
+    expected = [whole * BALLS_PER_OVER + part]
+    assert parse_overs([f"{whole}.{part}"]).tolist() == expected
+    assert parse_overs([whole + part / 10]).tolist() == expected
+
+
+@given(st.lists(st.integers(min_value=0, max_value=10 ** 7), min_size=1))
+def test_balls_round_trip_through_notation(balls):
+    assert parse_overs(overs_notation(pd.Series(balls))).tolist() == balls
+
+
+@given(wholes, st.integers(min_value=BALLS_PER_OVER, max_value=9))
+def test_ball_digits_six_to_nine_are_invalid(whole, digit):
+    for values in ([f"{whole}.{digit}"], [whole + digit / 10]):
+        with pytest.raises(ValueError):
+            parse_overs(values, errors="raise")
+        assert invalid_overs(values).tolist() == [True]
+
+
+@given(wholes, parts, st.integers(min_value=1, max_value=9))
+def test_second_decimal_place_is_invalid(whole, part, second):
+    for values in ([f"{whole}.{part}{second}"], [whole + part / 10 + second / 100]):
+        with pytest.raises(ValueError):
+            parse_overs(values, errors="raise")
+        assert invalid_overs(values).tolist() == [True]
+
+
+@given(st.integers(min_value=1, max_value=10 ** 6), parts)
+def test_negative_values_are_invalid(whole, part):
+    for values in ([-whole], [f"-{whole}.{part}"], [-(whole + part / 10)], pd.Series([-whole], dtype="int64")):
+        with pytest.raises(ValueError):
+            parse_overs(values, errors="raise")
+        assert invalid_overs(values).tolist() == [True]
+
+
+@given(st.lists(st.tuples(st.integers(min_value=0, max_value=10 ** 5), st.integers(min_value=1, max_value=10 ** 6),
+                          st.integers(min_value=1, max_value=10 ** 3)), min_size=1))
+def test_rates_match_exact_fractions(rows):
+    runs, balls, wickets = (pd.Series(col) for col in zip(*rows))
+    assert economy(runs, balls).tolist() == [float(Fraction(r * BALLS_PER_OVER, b)) for r, b, _ in rows]
+    assert strike_rate(balls, wickets).tolist() == [float(Fraction(b, w)) for _, b, w in rows]
+
+
+# ─────────────────────────────
+# Round Trip
+# ─────────────────────────────
+def test_notation_round_trip():
+    balls = pd.Series(np.arange(0, 50 * BALLS_PER_OVER + 1))
+    assert parse_overs(overs_notation(balls)).tolist() == balls.tolist()
+
+
+@pytest.mark.parametrize("overs, balls", [
+    (0, 0), (4, 24), (0.1, 1), (3.5, 23), (10.0, 60), (19.3, 117),
+    ("3.5", 23), ("4", 24), ("0.0", 0),
+])
+def test_parse_known_values(overs, balls):
+    assert parse_overs([overs]).tolist() == [balls]
+
+
+@pytest.mark.parametrize("values", [[1, 2, 10], [1.2, 3.5, 0.0], ["1.2", "3.5", "0"]])
+def test_parse_returns_int64(values):
+    assert parse_overs(values).dtype == "int64"
+
+
+def test_missing_values_count_as_zero_balls():
+    assert parse_overs([3.5, None, np.nan]).tolist() == [23, 0, 0]
+    assert parse_overs(pd.Series([3, None], dtype="Int64")).tolist() == [18, 0]
+
+
+def test_keeps_index_and_name():
+    series = pd.Series([1.1, 2.0], index=[7, 3], name="overs")
+    result = parse_overs(series)
+    assert result.index.tolist() == [7, 3]
+    assert result.name == "overs"
+
+
+# ─────────────────────────────
+# Invalid Notation
+# ─────────────────────────────
+@pytest.mark.parametrize("overs", [0.6, 3.7, 3.8, 10.9, "2.6", "4.9"])
+def test_rejects_ball_digits_six_to_nine(overs):
+    with pytest.raises(ValueError):
+        parse_overs([overs])
+    assert invalid_overs([overs]).tolist() == [True]
+
+
+@pytest.mark.parametrize("overs", [3.55, 0.25, 1.11, "2.05", "1.123"])
+def test_rejects_more_than_one_decimal_place(overs):
+    with pytest.raises(ValueError):
+        parse_overs([overs])
+    assert invalid_overs([overs]).tolist() == [True]
+
+
+@pytest.mark.parametrize("values", [[-1], [-0.5], [-3.2], ["-2"], pd.Series([-1, 2], dtype="int64")])
+def test_rejects_negative_values(values):
+    with pytest.raises(ValueError):
+        parse_overs(values)
+
+
+@pytest.mark.parametrize("overs", [np.inf, -np.inf, "abc", "3.5.1"])
+def test_rejects_unparseable_values(overs):
+    with pytest.raises(ValueError):
+        parse_overs([1.0, overs])
+
+
+# ─────────────────────────────
+# errors="coerce" vs errors="raise"
+# ─────────────────────────────
+def test_coerce_marks_only_invalid_values():
+    values = pd.Series([3.5, 3.7, None, -1, "2.1", 1.25])
+    result = parse_overs(values, errors="coerce")
+    assert result.dtype == "Int64"
+    assert result.isna().tolist() == [False, True, False, True, False, True]
+    assert result.dropna().tolist() == [23, 0, 13]
+    assert invalid_overs(values).tolist() == result.isna().tolist()
+
+
+def test_raise_reports_the_bad_values():
+    with pytest.raises(ValueError, match="2 invalid overs"):
+        parse_overs([3.5, 3.7, 1.25], errors="raise")
+
+
+def test_both_modes_agree_on_valid_input():
+    values = [0.1, 5.5, 12.0, None]
+    assert parse_overs(values, errors="coerce").tolist() == parse_overs(values, errors="raise").tolist()
+    assert parse_overs(values, errors="coerce").dtype == "int64"
+
+
+def test_unknown_errors_mode():
+    with pytest.raises(ValueError, match="errors must be"):
+        parse_overs([1.0], errors="ignore")
+
+
+# ─────────────────────────────
+# Rates
+# ─────────────────────────────
+def test_rates_use_exact_balls():
+    balls = parse_overs(pd.Series([3.5, 4.0]))
+    assert economy(pd.Series([23, 24]), balls).tolist() == [6.0, 6.0]
+    assert strike_rate(balls, pd.Series([1, 2])).tolist() == [23.0, 12.0]
+    assert overs_notation(balls).tolist() == [3.5, 4.0]
@@ -0,0 +1,110 @@
+"""Lightweight per-stage timing spans, grouped per script run and optionally logged as JSONL.
+
+    run = timing.start_run(log_path="timing.jsonl")
+    with timing.span("query", table="wickets") as s:
+        ...
+        s["rows"] = len(df)
+
+Spans only record while a run is active in the current context, so library code
+can be instrumented unconditionally. Work handed to a thread pool keeps the run
+when the callable is wrapped with in_run().
+"""
+import contextvars
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+_run = contextvars.ContextVar("timing_run", default=None)
+_open = contextvars.ContextVar("timing_open_span", default=None)
+_log_lock = threading.Lock()
+
+
+class Run:
+    """The spans recorded during one script run."""
+
+    def __init__(self, name: str = "run", log_path: str = None, **fields):
+        self.id = uuid.uuid4().hex[:12]
+        self.name = name
+        self.fields = fields
+        self.log_path = log_path
+        self.started = time.time()
+        self._t0 = time.perf_counter()
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def add(self, record: dict):
+        with self._lock:
+            self.spans.append(record)
+        if self.log_path:
+            line = json.dumps({"run": self.id, "run_name": self.name, **self.fields, **record}, default=str)
+            with _log_lock, open(self.log_path, "a") as f:
+                f.write(line + "\n")
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self._t0) * 1000, 2)
+
+
+def start_run(name: str = "run", log_path: str = None, **fields) -> Run:
+    """Start recording spans for the current context (e.g. one Streamlit rerun)."""
+    run = Run(name, log_path, **fields)
+    _run.set(run)
+    _open.set(None)
+    return run
+
+
+def current_run():
+    return _run.get()
+
+
+def active() -> bool:
+    """True when a span is open in this context, i.e. add() would record something."""
+    return _open.get() is not None
+
+
+@contextmanager
+def span(name: str, **fields):
+    """Time the block as `name`. The yielded dict can be filled with counts (rows, bytes...)."""
+    run = _run.get()
+    if run is None:
+        yield dict(fields)
+        return
+    record = {"span": name, **fields}
+    start = time.perf_counter()
+    token = _open.set(record)
+    try:
+        yield record
+    except BaseException as exc:
+        record["error"] = type(exc).__name__
+        raise
+    finally:
+        _open.reset(token)
+        end = time.perf_counter()
+        record["start_ms"] = round((start - run._t0) * 1000, 2)
+        record["ms"] = round((end - start) * 1000, 2)
+        record["thread"] = threading.current_thread().name
+        run.add(record)
+
+
+def add(**counts):
+    """Add numeric `counts` to the innermost open span (no-op outside a span)."""
+    record = _open.get()
+    if record is not None:
+        for key, value in counts.items():
+            record[key] = record.get(key, 0) + value
+
+
+def in_run(fn):
+    """Wrap `fn` so calls on other threads record into the caller's run."""
+    run = _run.get()
+    if run is None:
+        return fn
+
+    def call(*args, **kwargs):
+        token = _run.set(run)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _run.reset(token)
+    return call
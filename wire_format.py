@@ -0,0 +1,118 @@
+"""PostgREST reader that asks for CSV or Arrow instead of JSON.
+
+RestClient mirrors the small part of the supabase query builder that supabase_fetch
+uses (table/select/in_/eq/gt/lt/or_/order/limit/execute), so it can be passed to
+fetch_rows / fetch_latest in place of the Supabase client. Responses are parsed
+straight into a DataFrame, skipping the JSON -> list of dicts -> DataFrame step.
+
+PostgREST serves text/csv natively. Arrow needs a proxy in front of PostgREST that
+understands application/vnd.apache.arrow.stream; point `url` at it. When the server
+answers 406/415 (format not supported) the client falls back to JSON for good.
+"""
+import io
+import json
+
+import httpx
+import pandas as pd
+
+from schema import CATEGORY, SCHEMAS
+from supabase_fetch import filter_value
+
+ACCEPT = {
+    "json": "application/json",
+    "csv": "text/csv",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+
+class RestResponse:
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+
+
+class RestQuery:
+    def __init__(self, client, table: str):
+        self.client = client
+        self.table = table
+        self.params = []
+
+    def select(self, columns: str):
+        self.params.append(("select", columns))
+        return self
+
+    def in_(self, column: str, values: list):
+        self.params.append((column, f"in.({','.join(filter_value(v) for v in values)})"))
+        return self
+
+    def eq(self, column: str, value):
+        self.params.append((column, f"eq.{value}"))
+        return self
+
+    def gt(self, column: str, value):
+        self.params.append((column, f"gt.{value}"))
+        return self
+
+    def lt(self, column: str, value):
+        self.params.append((column, f"lt.{value}"))
+        return self
+
+    def or_(self, filters: str):
+        """`filters` is a PostgREST logic tree without the parentheses, as in postgrest-py."""
+        self.params.append(("or", f"({filters})"))
+        return self
+
+    def order(self, column: str, desc: bool = False):
+        # Repeated calls add tie-breakers to the one order parameter, as postgrest-py does
+        term = f"{column}.{'desc' if desc else 'asc'}"
+        for i, (name, value) in enumerate(self.params):
+            if name == "order":
+                self.params[i] = ("order", f"{value},{term}")
+                return self
+        self.params.append(("order", term))
+        return self
+
+    def limit(self, count: int):
+        self.params.append(("limit", str(count)))
+        return self
+
+    def execute(self) -> RestResponse:
+        return self.client.get(self.table, self.params)
+
+
+class RestClient:
+    """Read-only PostgREST client returning DataFrames, in `fmt` = json, csv or arrow."""
+
+    def __init__(self, url: str, key: str, http: httpx.Client = None, fmt: str = "csv"):
+        if fmt not in ACCEPT:
+            raise ValueError(f"Unknown wire format: {fmt}")
+        self.url = url.rstrip("/")
+        self.key = key
+        self.http = http or httpx.Client()
+        self.fmt = fmt
+
+    def table(self, name: str) -> RestQuery:
+        return RestQuery(self, name)
+
+    def get(self, table: str, params: list, fmt: str = None) -> RestResponse:
+        fmt = fmt or self.fmt
+        headers = {"apikey": self.key, "Authorization": f"Bearer {self.key}", "Accept": ACCEPT[fmt]}
+        res = self.http.get(f"{self.url}/{table}", params=params, headers=headers)
+        if fmt != "json" and res.status_code in (406, 415):
+            self.fmt = "json"
+            return self.get(table, params, "json")
+        res.raise_for_status()
+        return RestResponse(decode(res.content, res.headers.get("content-type", ""), table))
+
+
+def decode(content: bytes, content_type: str, table: str = None) -> pd.DataFrame:
+    """Parse a PostgREST response body into a DataFrame based on its content type."""
+    if "arrow" in content_type:
+        import pyarrow as pa
+        return pa.ipc.open_stream(content).read_pandas()
+    if "csv" in content_type:
+        if not content.strip():
+            return pd.DataFrame()
+        # Categorical columns are built while parsing; numbers are typed by the parser
+        categories = {col: CATEGORY for col, dtype in SCHEMAS.get(table, {}).items() if dtype == CATEGORY}
+        return pd.read_csv(io.BytesIO(content), dtype=categories)
+    return pd.DataFrame(json.loads(content))